@@ -1,4 +1,7 @@
 # core/decision/anti_tampering_qualifier.py
+import re
+from functools import lru_cache
+
 
 class AntiTamperingDecisionQualifier:
     """
@@ -27,6 +30,17 @@ class AntiTamperingDecisionQualifier:
         "assert",
     ]
 
+    # each keyword table compiled once into a single alternation
+    _REQUIRED_RE = re.compile("|".join(re.escape(k) for k in REQUIRED_SEMANTICS))
+    _NOISE_RE = re.compile("|".join(re.escape(n) for n in NOISE_EXCEPTIONS))
+
+    QUALIFYING_DECISIONS = frozenset(("throw_exception", "conditional_abort"))
+
+    def __init__(self):
+        # (has_semantic, has_noise) for the class/method part of the
+        # blob, shared by every decision of the same method
+        self._head_flags = lru_cache(maxsize=65536)(self._head_flags_for)
+
     def qualify(self, decisions):
         qualified = []
         for d in decisions:
@@ -35,21 +49,28 @@ class AntiTamperingDecisionQualifier:
         return qualified
 
     def is_relevant(self, d) -> bool:
-        if d.decision_type not in ["throw_exception", "conditional_abort"]:
+        if d.decision_type not in self.QUALIFYING_DECISIONS:
             return False
 
-        blob = (
-            f"{d.class_name} "
-            f"{d.method_name} "
-            f"{' '.join(d.instruction_snippet)}"
-        ).lower()
+        head_semantic, head_noise = self._head_flags(d.class_name, d.method_name)
+        if head_noise:
+            return False
+
+        snippet = " ".join(d.instruction_snippet).lower()
 
         # Must have anti-tampering semantic
-        if not any(k in blob for k in self.REQUIRED_SEMANTICS):
+        if not (head_semantic or self._REQUIRED_RE.search(snippet)):
             return False
 
         # Filter obvious noise
-        if any(n in blob for n in self.NOISE_EXCEPTIONS):
+        if self._NOISE_RE.search(snippet):
             return False
 
         return True
+
+    def _head_flags_for(self, class_name, method_name) -> tuple:
+        head = f"{class_name} {method_name}".lower()
+        return (
+            self._REQUIRED_RE.search(head) is not None,
+            self._NOISE_RE.search(head) is not None,
+        )
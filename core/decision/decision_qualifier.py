@@ -1,4 +1,6 @@
 # core/decision/decision_qualifier.py
+import re
+from functools import lru_cache
 from typing import List
 
 
@@ -44,6 +46,9 @@ class DecisionQualifierV1:
         "io/flutter/",
     )
 
+    # only enforcing decisions are considered at all
+    QUALIFYING_DECISIONS = frozenset(("throw_exception", "conditional_abort"))
+
     SECURITY_METHOD_HINTS = [
         "verify",
         "check",
@@ -60,11 +65,29 @@ class DecisionQualifierV1:
         "ssl",
     ]
 
+    # each keyword list as one compiled alternation: a single C-level
+    # search per name instead of a Python loop of `in` checks
+    _SECURITY_CONTEXT_RE = re.compile(
+        "|".join(re.escape(k) for k in SECURITY_CONTEXT_KEYWORDS)
+    )
+    _SECURITY_METHOD_RE = re.compile(
+        "|".join(re.escape(k) for k in SECURITY_METHOD_HINTS)
+    )
+    _SECURITY_CLASS_RE = re.compile(
+        "|".join(re.escape(k) for k in SECURITY_CLASS_HINTS)
+    )
+
+    def __init__(self):
+        # decisions from the same method share class/method context,
+        # so the keyword checks are memoized per (class_name, method_name)
+        self._security_context = lru_cache(maxsize=65536)(self._security_context_for)
+        self._security_method = lru_cache(maxsize=65536)(self._security_method_for)
+
     def qualify(self, decisions: List):
         return [d for d in decisions if self.is_security_relevant(d)]
 
     def is_security_relevant(self, d) -> bool:
-        if d.decision_type not in ["throw_exception", "conditional_abort"]:
+        if d.decision_type not in self.QUALIFYING_DECISIONS:
             return False
 
         if d.decision_type == "throw_exception":
@@ -87,82 +110,34 @@ class DecisionQualifierV1:
         return exception_type in self.SECURITY_RELEVANT_EXCEPTIONS if exception_type else False
 
     def _has_security_context(self, d) -> bool:
-        blob = f"{d.class_name} {d.method_name}".lower()
-        return any(k in blob for k in self.SECURITY_CONTEXT_KEYWORDS)
+        return self._security_context(d.class_name, d.method_name)
+
+    def _security_context_for(self, class_name, method_name) -> bool:
+        blob = f"{class_name} {method_name}".lower()
+        return self._SECURITY_CONTEXT_RE.search(blob) is not None
 
     def _is_framework_noise(self, d) -> bool:
         return (d.class_name or "").startswith(self.FRAMEWORK_NOISE_PREFIXES)
 
     def _extract_exception_type(self, d) -> str:
+        # new-instance vX, Lpkg/SomeException;  ->  Lpkg/SomeException;
+        # Error types count too: AssertionError is whitelisted
         for line in d.instruction_snippet:
-            if line.strip().startswith("new-instance") and "Exception;" in line:
-                return line.split(",")[-1].strip()
+            if "Exception;" not in line and "Error;" not in line:
+                continue
+
+            line = line.strip()
+            if line.startswith("new-instance"):
+                return line.rpartition(",")[2].strip()
         return ""
 
     def _is_security_method(self, d) -> bool:
-        method = (d.method_name or "").lower()
-        cls = (d.class_name or "").lower()
+        return self._security_method(d.class_name, d.method_name)
+
+    def _security_method_for(self, class_name, method_name) -> bool:
+        method = (method_name or "").lower()
+        cls = (class_name or "").lower()
         return (
-            any(k in method for k in self.SECURITY_METHOD_HINTS)
-            or any(k in cls for k in self.SECURITY_CLASS_HINTS)
+            self._SECURITY_METHOD_RE.search(method) is not None
+            or self._SECURITY_CLASS_RE.search(cls) is not None
         )
-
-
-# --------------------------------------------------
-# Anti-Tampering: Signal-aligned Decision Qualifier
-# --------------------------------------------------
-
-class AntiTamperingDecisionQualifier:
-    """
-    Narrow qualifier for Anti-Tampering related decisions.
-
-    IMPORTANT:
-    - Used only as secondary evidence
-    - Signal scanners remain primary
-    """
-
-    KEYWORDS = [
-        "signature",
-        "checksum",
-        "integrity",
-        "packagename",
-        "installer",
-        "dex",
-        "asset",
-    ]
-
-    CONTEXT_GUARDS = [
-        "packagemanager",
-        "messageDigest".lower(),
-        "signature",
-        "buildconfig",
-        "getpackagename",
-        "getinstallerpackagename",
-    ]
-
-    FRAMEWORK_NOISE = [
-        "kotlin/",
-        "androidx/",
-    ]
-
-    def qualify(self, decisions):
-        qualified = []
-
-        for d in decisions:
-            blob = (
-                f"{d.class_name} {d.method_name} "
-                f"{' '.join(d.instruction_snippet)}"
-            ).lower()
-
-            if any(d.class_name.startswith(p) for p in self.FRAMEWORK_NOISE):
-                continue
-
-            if not any(k in blob for k in self.KEYWORDS):
-                continue
-
-            if not any(c in blob for c in self.CONTEXT_GUARDS):
-                continue
-
-            qualified.append(d)
-
-        return qualified
@@ -1,11 +1,57 @@
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 
+# --------------------------------------------------
+# Lazy source window
+# --------------------------------------------------
+class SourceSnippet(Sequence):
+    """
+    Read-only window [start:end] over a file's source lines.
+    Behaves like a list of lines, but nothing is copied until the
+    snippet is actually read (most raw decisions never are).
+    """
+
+    __slots__ = ("_lines", "_start", "_end")
+
+    def __init__(self, lines: List[str], start: int, end: int):
+        self._lines = lines
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._lines[self._start:self._end][i]
+
+        n = self._end - self._start
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("snippet index out of range")
+        return self._lines[self._start + i]
+
+    def __iter__(self):
+        return map(self._lines.__getitem__, range(self._start, self._end))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 # --------------------------------------------------
 # Decision (Detection-level)
 # --------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class DecisionPoint:
     """
     Represents a control-flow enforcement decision
@@ -20,15 +66,20 @@ class DecisionPoint:
     reason: str                  # heuristic reason
 
     instruction_index: int
-    instruction_snippet: List[str]
+    instruction_snippet: Sequence         # List[str] or SourceSnippet
 
     exception_type: Optional[str] = None
 
+    # source lines of the whole file (internal use: slicing / signals)
+    _smali_lines: Optional[List[str]] = field(
+        default=None, repr=False, compare=False
+    )
+
 
 # --------------------------------------------------
 # Evidence (Localization-level)
 # --------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class DecisionEvidenceSlice:
     """
     Concrete evidence slice extracted from a decision point.
@@ -46,3 +97,14 @@ class DecisionEvidenceSlice:
     evidence_lines: List[str]
 
     related_decision_id: Optional[int] = None
+
+    def search_blob(self) -> str:
+        """
+        Lowercased "class method evidence..." text matched by the
+        keyword-based strategy inferers.
+        """
+        return (
+            f"{self.class_name} "
+            f"{self.method_name} "
+            f"{' '.join(self.evidence_lines)}"
+        ).lower()
@@ -1,5 +1,6 @@
 # core/decision/qualifier.py
 
+import re
 from typing import List
 from core.decision.models import DecisionPoint
 
@@ -41,6 +42,22 @@ class DecisionQualifier:
         "kotlin/jvm",
     )
 
+    # Noise (exception + framework) and accept (exception + package)
+    # tables folded into one alternation each, matched in a single scan
+    _NOISE_RE = re.compile(
+        "|".join(
+            re.escape(k)
+            for k in NOISE_EXCEPTION_KEYWORDS + NOISE_FRAMEWORK_KEYWORDS
+        )
+    )
+
+    _ACCEPT_RE = re.compile(
+        "|".join(
+            re.escape(k)
+            for k in SECURITY_EXCEPTION_KEYWORDS + SECURITY_PACKAGE_KEYWORDS
+        )
+    )
+
     def qualify(self, decisions: List[DecisionPoint]) -> List[DecisionPoint]:
         qualified: List[DecisionPoint] = []
 
@@ -55,22 +72,12 @@ class DecisionQualifier:
     def _is_security_relevant(self, d: DecisionPoint) -> bool:
         blob = self._blob(d)
 
-        # 1) Hard drop known noise
-        if any(k in blob for k in self.NOISE_EXCEPTION_KEYWORDS):
+        # 1) Hard drop known noise (exceptions / frameworks)
+        if self._NOISE_RE.search(blob):
             return False
 
-        if any(k in blob for k in self.NOISE_FRAMEWORK_KEYWORDS):
-            return False
-
-        # 2) Strong accept: security exception
-        if any(k in blob for k in self.SECURITY_EXCEPTION_KEYWORDS):
-            return True
-
-        # 3) Accept if within security-related packages
-        if any(k in blob for k in self.SECURITY_PACKAGE_KEYWORDS):
-            return True
-
-        return False
+        # 2) Accept: security exception or security-related package
+        return self._ACCEPT_RE.search(blob) is not None
 
     def _blob(self, d: DecisionPoint) -> str:
         """
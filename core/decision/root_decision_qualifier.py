@@ -1,3 +1,7 @@
+import re
+from functools import lru_cache
+
+
 class RootDecisionQualifier:
     """
     Root Decision Qualifier v2
@@ -18,10 +22,19 @@ class RootDecisionQualifier:
         "mount",
     ]
 
-    FRAMEWORK_NOISE = [
+    FRAMEWORK_NOISE = (
         "kotlin/",
         "androidx/",
-    ]
+    )
+
+    _ROOT_CONTEXT_RE = re.compile(
+        "|".join(re.escape(k) for k in ROOT_CONTEXT_KEYWORDS)
+    )
+
+    def __init__(self):
+        # decisions of one method repeat its class/method names,
+        # so the keyword check on that part is memoized per pair
+        self._root_context = lru_cache(maxsize=65536)(self._root_context_for)
 
     def qualify(self, decisions):
         qualified = []
@@ -31,16 +44,18 @@ class RootDecisionQualifier:
         return qualified
 
     def is_root_relevant(self, d) -> bool:
-        blob = (
-            f"{d.class_name} "
-            f"{d.method_name} "
-            f"{' '.join(d.instruction_snippet)}"
-        ).lower()
-
-        if not any(k in blob for k in self.ROOT_CONTEXT_KEYWORDS):
+        # cheap prefix rejection before building the blob
+        if d.class_name.startswith(self.FRAMEWORK_NOISE):
             return False
 
-        if any(d.class_name.startswith(p) for p in self.FRAMEWORK_NOISE):
-            return False
+        if self._root_context(d.class_name, d.method_name):
+            return True
+
+        # no keyword contains a space, so none can straddle the
+        # class/method names and the snippet
+        snippet = " ".join(d.instruction_snippet).lower()
+        return bool(self._ROOT_CONTEXT_RE.search(snippet))
 
-        return True
+    def _root_context_for(self, class_name, method_name) -> bool:
+        blob = f"{class_name} {method_name}".lower()
+        return bool(self._ROOT_CONTEXT_RE.search(blob))
@@ -1,7 +1,10 @@
 # core/decision/smali_decision_finder.py
 
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import List
-from core.decision.models import DecisionPoint
+from core.decision.models import DecisionPoint, SourceSnippet
 
 
 class SmaliDecisionFinder:
@@ -26,6 +29,16 @@ class SmaliDecisionFinder:
         "if-gez",
     )
 
+    THROW_LOOKAHEAD = 6
+    ABORT_LOOKAHEAD = 8
+
+    # substrings a line must contain to open/close a method or yield a
+    # decision; every other line is skipped without strip()/startswith
+    CANDIDATE_MARKERS = (".method", ".end method", "throw", "if-") + EXIT_CALLS
+
+    ABORT_MARKERS = ("->cancel()V", "->close()V", "->disconnect()V", "return")
+    ABORT_PREFIXES = ("return-void", "return ")
+
     def __init__(self, context_window: int = 5):
         self.context_window = context_window
 
@@ -38,120 +51,125 @@ class SmaliDecisionFinder:
         decisions: List[DecisionPoint] = []
         current_method = "<unknown>"
 
-        for idx, line in enumerate(smali_lines):
-            stripped = line.strip()
+        # every decision of the file/method shares one string object
+        class_name = sys.intern(class_name)
+
+        # one joined copy of the file; lines are located by offset
+        ends = list(accumulate(len(l) + 1 for l in smali_lines))
+        text = "\n".join(smali_lines)
+
+        # sorted throw / abort line indices,
+        # built lazily on the first if-* of the file
+        throw_lines = None
+        abort_lines = None
+
+        for idx in self._line_hits(self.CANDIDATE_MARKERS, text, ends):
+            stripped = smali_lines[idx].strip()
 
             # -----------------------------
             # Track current method
             # -----------------------------
             if stripped.startswith(".method"):
-                current_method = stripped.replace(".method", "").strip()
+                current_method = sys.intern(
+                    stripped.replace(".method", "").strip()
+                )
                 continue
 
             if stripped.startswith(".end method"):
                 current_method = "<unknown>"
                 continue
 
+            # (decision_type, reason) pairs raised by this line; the
+            # snippet and DecisionPoints are built once, at the tail
+            kinds = []
+
             # -----------------------------
             # THROW = HARD DECISION
             # -----------------------------
             if "throw" in stripped:
-                snippet = self._snippet(smali_lines, idx)
+                kinds.append(("throw_exception", "explicit_exception_throw"))
+
+            else:
+                # -----------------------------
+                # SYSTEM EXIT / KILL
+                # -----------------------------
+                for exit_call in self.EXIT_CALLS:
+                    if exit_call in stripped:
+                        kinds.append(("process_termination", "explicit_exit_call"))
+                        break
+
+                # -----------------------------
+                # CONDITIONAL + THROW (Pattern)
+                # if-* followed by throw nearby
+                # -----------------------------
+                if stripped.startswith(self.IF_OPCODES):
+                    if throw_lines is None:
+                        throw_lines = self._line_hits(("throw",), text, ends)
+                        abort_lines = [
+                            i
+                            for i in self._line_hits(self.ABORT_MARKERS, text, ends)
+                            if self._is_abort_line(smali_lines[i])
+                        ]
+
+                    if self._has_hit_within(throw_lines, idx, self.THROW_LOOKAHEAD):
+                        kinds.append(
+                            ("conditional_enforcement", "if_condition_leads_to_throw")
+                        )
+
+                    if self._has_hit_within(abort_lines, idx, self.ABORT_LOOKAHEAD):
+                        kinds.append(
+                            ("conditional_abort", "if_condition_leads_to_abort")
+                        )
+
+            if not kinds:
+                continue
+
+            snippet = self._snippet(smali_lines, idx)
+            for decision_type, reason in kinds:
                 decisions.append(
                     DecisionPoint(
                         language="smali",
                         class_name=class_name,
                         method_name=current_method,
-                        decision_type="throw_exception",
-                        reason="explicit_exception_throw",
+                        decision_type=decision_type,
+                        reason=reason,
                         instruction_index=idx,
                         instruction_snippet=snippet,
                     )
                 )
-                continue
-
-            # -----------------------------
-            # SYSTEM EXIT / KILL
-            # -----------------------------
-            for exit_call in self.EXIT_CALLS:
-                if exit_call in stripped:
-                    snippet = self._snippet(smali_lines, idx)
-                    decisions.append(
-                        DecisionPoint(
-                            language="smali",
-                            class_name=class_name,
-                            method_name=current_method,
-                            decision_type="process_termination",
-                            reason="explicit_exit_call",
-                            instruction_index=idx,
-                            instruction_snippet=snippet,
-                        )
-                    )
-                    break
-
-            # -----------------------------
-            # CONDITIONAL + THROW (Pattern)
-            # if-* followed by throw nearby
-            # -----------------------------
-            if stripped.startswith(self.IF_OPCODES):
-                if self._has_throw_nearby(smali_lines, idx):
-                    snippet = self._snippet(smali_lines, idx)
-                    decisions.append(
-                        DecisionPoint(
-                            language="smali",
-                            class_name=class_name,
-                            method_name=current_method,
-                            decision_type="conditional_enforcement",
-                            reason="if_condition_leads_to_throw",
-                            instruction_index=idx,
-                            instruction_snippet=snippet,
-                        )
-                    )
-
-            if stripped.startswith(self.IF_OPCODES):
-                if self._has_abort_nearby(smali_lines, idx):
-                    snippet = self._snippet(smali_lines, idx)
-                    decisions.append(
-                        DecisionPoint(
-                            language="smali",
-                            class_name=class_name,
-                            method_name=current_method,
-                            decision_type="conditional_abort",
-                            reason="if_condition_leads_to_abort",
-                            instruction_index=idx,
-                            instruction_snippet=snippet,
-                        )
-                    )
 
         return decisions
 
     # -----------------------------------------------------
 
-    def _snippet(self, lines: List[str], idx: int) -> List[str]:
+    def _snippet(self, lines: List[str], idx: int) -> SourceSnippet:
         start = max(0, idx - self.context_window)
         end = min(len(lines), idx + self.context_window + 1)
-        return lines[start:end]
-
-    def _has_throw_nearby(self, lines: List[str], idx: int) -> bool:
-        lookahead = 6
-        for i in range(idx, min(idx + lookahead, len(lines))):
-            if "throw" in lines[i]:
-                return True
-        return False
-    
-    def _has_abort_nearby(self, lines: List[str], idx: int) -> bool:
-        lookahead = 8
-        for i in range(idx, min(idx + lookahead, len(lines))):
-            line = lines[i].strip()
-
-            if (
-                "->cancel()V" in line
-                or "->close()V" in line
-                or "->disconnect()V" in line
-                or line.startswith("return-void")
-                or line.startswith("return ")
-            ):
-                return True
-
-        return False
-
+        return SourceSnippet(lines, start, end)
+
+    def _line_hits(self, markers, text: str, ends: List[int]) -> List[int]:
+        """
+        Sorted indices of the lines containing any of `markers`, found
+        with str.find over the joined file (one hit per line is enough).
+        """
+        hits = set()
+        for marker in markers:
+            pos = text.find(marker)
+            while pos != -1:
+                i = bisect_right(ends, pos)
+                hits.add(i)
+                pos = text.find(marker, ends[i])
+        return sorted(hits)
+
+    def _has_hit_within(self, hits: List[int], idx: int, lookahead: int) -> bool:
+        k = bisect_left(hits, idx)
+        return k < len(hits) and hits[k] < idx + lookahead
+
+    def _is_abort_line(self, line: str) -> bool:
+        line = line.strip()
+        return (
+            "->cancel()V" in line
+            or "->close()V" in line
+            or "->disconnect()V" in line
+            or line.startswith(self.ABORT_PREFIXES)
+        )
@@ -2,6 +2,24 @@ from dataclasses import dataclass
 from typing import Optional, Dict
 
 
+def _mentions(value, needle: str) -> bool:
+    """
+    True if needle occurs in any key / value of a (nested) evidence
+    structure. Walks the containers instead of rendering them to one
+    big string; leaves fall back to repr() like str(dict) would.
+    """
+    if isinstance(value, str):
+        return needle in value
+    if isinstance(value, dict):
+        return any(
+            _mentions(k, needle) or _mentions(v, needle)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(_mentions(v, needle) for v in value)
+    return needle in repr(value)
+
+
 @dataclass
 class LocalizedProtection:
     pattern_type: str
@@ -22,8 +40,13 @@ class LocalizedProtection:
             "layer": self.location.get("layer"),
             "strategy": (
                 "Memory-based"
-                if "maps" in str(self.evidence)
+                if self._is_memory_based()
                 else "API-based"
             ),
             "impact": self.impact_hint
         }
+
+    def _is_memory_based(self) -> bool:
+        if isinstance(self.evidence, dict):
+            return _mentions(self.evidence, "maps")
+        return "maps" in str(self.evidence)
@@ -1,6 +1,8 @@
 import os
-from typing import List
+from itertools import groupby
+from typing import List, Optional
 
+from core.parallel import process_map
 from core.decision.smali_decision_finder import SmaliDecisionFinder
 from core.decision.models import DecisionPoint
 from core.decision.decision_qualifier import DecisionQualifierV1
@@ -8,6 +10,27 @@ from core.slicing.decision.smali_ssl_pin_slice import SmaliSSLPinningEvidenceSli
 from core.decision.models import DecisionEvidenceSlice
 
 
+# -------------------------
+# Per-file worker (process pool)
+# -------------------------
+_worker_finder: Optional[SmaliDecisionFinder] = None
+
+
+def _init_worker(finder: SmaliDecisionFinder):
+    global _worker_finder
+    _worker_finder = finder
+
+
+def _find_in_file(task, finder: Optional[SmaliDecisionFinder] = None):
+    smali_path, class_name = task
+    finder = finder or _worker_finder
+
+    with open(smali_path, "r", encoding="utf-8", errors="ignore") as f:
+        lines = f.readlines()
+
+    return lines, finder.find(smali_lines=lines, class_name=class_name)
+
+
 class DecisionLocalizationPipeline:
     """
     Decision-based localization pipeline
@@ -16,39 +39,19 @@ class DecisionLocalizationPipeline:
     - Phase 3: Evidence slicing (optional)
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.smali_finder = SmaliDecisionFinder()
         self.qualifier = DecisionQualifierV1()
         self.evidence_slicer = SmaliSSLPinningEvidenceSlicer()
 
+        # > 1 fans per-file decision finding out to a process pool
+        self.max_workers = max_workers
+
     # -------------------------
     # Phase 1 + 2
     # -------------------------
     def run_on_smali_dir(self, smali_root: str) -> List[DecisionPoint]:
-        raw_decisions: List[DecisionPoint] = []
-
-        for root, _, files in os.walk(smali_root):
-            for file in files:
-                if not file.endswith(".smali"):
-                    continue
-
-                smali_path = os.path.join(root, file)
-                class_name = self._class_name_from_path(smali_path)
-
-                with open(smali_path, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-
-                decisions = self.smali_finder.find(
-                    smali_lines=lines,
-                    class_name=class_name,
-                )
-
-                # attach source lines for later slicing
-                for d in decisions:
-                    d._smali_lines = lines  # internal use only
-
-                raw_decisions.extend(decisions)
-
+        raw_decisions = self.collect_raw_decisions(smali_root)
         return self.qualifier.qualify(raw_decisions)
 
     # -------------------------
@@ -60,49 +63,67 @@ class DecisionLocalizationPipeline:
 
         evidences: List[DecisionEvidenceSlice] = []
 
-        for d in decisions:
-            if not hasattr(d, "_smali_lines"):
+        # decisions arrive in file order: slice each file's batch together;
+        # batches without source lines are skipped in the same pass
+        for _, group in groupby(decisions, key=lambda d: id(d._smali_lines)):
+            group = list(group)
+            smali_lines = group[0]._smali_lines
+            if smali_lines is None:
                 continue
 
-            evidence = self.evidence_slicer.slice(
-                decision=d,
-                smali_lines=d._smali_lines,
+            evidences.extend(
+                self.evidence_slicer.slice_batch(
+                    decisions=group,
+                    smali_lines=smali_lines,
+                )
             )
-            evidences.append(evidence)
 
         return evidences
     
     def collect_raw_decisions(self, smali_root: str):
         raw_decisions = []
 
-        for root, _, files in os.walk(smali_root):
-            for file in files:
-                if not file.endswith(".smali"):
-                    continue
-
-                smali_path = os.path.join(root, file)
-                class_name = self._class_name_from_path(smali_path)
-
-                with open(smali_path, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-
-                file_decisions = self.smali_finder.find(
-                    smali_lines=lines,
-                    class_name=class_name,
-                )
+        tasks = [
+            (path, self._class_name_from_path(path))
+            for path in self._iter_smali_files(smali_root)
+        ]
+
+        if self.max_workers and self.max_workers > 1:
+            results = process_map(
+                _find_in_file,
+                tasks,
+                self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.smali_finder,),
+                chunksize=32,
+            )
+        else:
+            results = (
+                _find_in_file(task, self.smali_finder) for task in tasks
+            )
 
-                for d in file_decisions:
-                    d._smali_lines = lines
+        for lines, file_decisions in results:
+            # attach source lines for later slicing
+            for d in file_decisions:
+                d._smali_lines = lines  # internal use only
 
-                raw_decisions.extend(file_decisions)
+            raw_decisions.extend(file_decisions)
 
         return raw_decisions
 
     # -------------------------
     # Utilities
     # -------------------------
+    def _iter_smali_files(self, smali_root: str):
+        for root, _, files in os.walk(smali_root):
+            for file in files:
+                if file.endswith(".smali"):
+                    yield os.path.join(root, file)
+
     def _class_name_from_path(self, path: str) -> str:
-        cls = path.split("smali")[-1]
+        # only the tail after the last "smali" is used: rpartition
+        # finds it without splitting the whole path into a list
+        cls = path.rpartition("smali")[2]
         cls = cls.replace(os.sep, ".")
         cls = cls.replace(".smali", "")
         return cls.strip(".")
@@ -0,0 +1,32 @@
+# core/parallel.py
+
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+
+def process_map(
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+    max_workers: int,
+    *,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Iterable[Any] = (),
+    chunksize: int = 1,
+) -> List[Any]:
+    """
+    [fn(item) for item in items], computed on a process pool.
+
+    Results keep the order of `items`. `fn` (and `initializer`) must be
+    module-level so the workers can unpickle them.
+    """
+    if not items:
+        return []
+
+    # imported lazily: sequential runs never pay for multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        initializer=initializer,
+        initargs=tuple(initargs),
+    ) as ex:
+        return list(ex.map(fn, items, chunksize=chunksize))
@@ -13,11 +13,16 @@ Reference: ARAP paper evaluation methodology
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple, Set
 from enum import Enum
+import bisect
 import logging
 import math
 
 logger = logging.getLogger(__name__)
 
+# confidence histogram: upper edges of every bucket but the last
+_CONFIDENCE_BUCKETS = ("0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0")
+_CONFIDENCE_EDGES = (0.2, 0.4, 0.6, 0.8)
+
 
 @dataclass
 class ConfusionMatrix:
@@ -57,9 +62,11 @@ class ConfusionMatrix:
     @property
     def f1_score(self) -> float:
         """F1 Score: 2 * (Precision * Recall) / (Precision + Recall)"""
-        if self.precision + self.recall == 0:
+        # read each derived property once instead of twice
+        precision, recall = self.precision, self.recall
+        if precision + recall == 0:
             return 0.0
-        return 2 * (self.precision * self.recall) / (self.precision + self.recall)
+        return 2 * (precision * recall) / (precision + recall)
     
     @property
     def specificity(self) -> float:
@@ -104,9 +111,10 @@ class DetectionMetrics:
     @property
     def f1_score(self) -> float:
         """F1 Score"""
-        if self.precision + self.recall == 0:
+        precision, recall = self.precision, self.recall
+        if precision + recall == 0:
             return 0.0
-        return 2 * (self.precision * self.recall) / (self.precision + self.recall)
+        return 2 * (precision * recall) / (precision + recall)
 
 
 @dataclass
@@ -139,9 +147,11 @@ class MetricsCalculator:
             DetectionMetrics with precision, recall, F1
         """
         
+        # one intersection; the other two counts follow arithmetically
+        # instead of materializing both set differences
         correctly_detected = len(ground_truth & detected)
-        missed = len(ground_truth - detected)
-        false_pos = len(detected - ground_truth)
+        missed = len(ground_truth) - correctly_detected
+        false_pos = len(detected) - correctly_detected
         
         return DetectionMetrics(
             total_expected=len(ground_truth),
@@ -190,30 +200,19 @@ class MetricsCalculator:
         variance = sum((c - mean) ** 2 for c in confidences) / n
         std = math.sqrt(variance)
         
-        # Min/Max
-        min_conf = min(confidences)
-        max_conf = max(confidences)
-        
-        # Distribution
-        distribution = {
-            "0.0-0.2": 0,
-            "0.2-0.4": 0,
-            "0.4-0.6": 0,
-            "0.6-0.8": 0,
-            "0.8-1.0": 0,
-        }
+        # Min/Max (already sorted)
+        min_conf = sorted_conf[0]
+        max_conf = sorted_conf[-1]
         
-        for conf in confidences:
-            if conf < 0.2:
-                distribution["0.0-0.2"] += 1
-            elif conf < 0.4:
-                distribution["0.2-0.4"] += 1
-            elif conf < 0.6:
-                distribution["0.4-0.6"] += 1
-            elif conf < 0.8:
-                distribution["0.6-0.8"] += 1
-            else:
-                distribution["0.8-1.0"] += 1
+        # Distribution: bucket boundaries are located by bisecting the
+        # sorted scores, so no per-score comparison chain is needed
+        distribution = {}
+        lower = 0
+        for label, edge in zip(_CONFIDENCE_BUCKETS, _CONFIDENCE_EDGES):
+            upper = bisect.bisect_left(sorted_conf, edge)
+            distribution[label] = upper - lower
+            lower = upper
+        distribution[_CONFIDENCE_BUCKETS[-1]] = n - lower
         
         return ConfidenceMetrics(
             mean_confidence=round(mean, 3),
@@ -413,49 +412,54 @@ class ResearchMetricsReporter:
         Generate markdown report for paper inclusion.
         """
         
-        report = """
+        # collect fragments and join once (no quadratic += rebuilds)
+        parts = ["""
 # Research Evaluation Results
 
 ## Summary
 
-"""
+"""]
         
         # Add evaluation metrics
         if evaluation_results:
-            report += "\n## Detection Accuracy Metrics\n\n"
-            report += "| App | GT | ILEAv1 | Prec | Recall | F1 | ILEAv2 | Prec | Recall | F1 |\n"
-            report += "|-----|----|----|----|----|----|----|----|----|----|\n"
+            parts.append("\n## Detection Accuracy Metrics\n\n")
+            parts.append("| App | GT | ILEAv1 | Prec | Recall | F1 | ILEAv2 | Prec | Recall | F1 |\n")
+            parts.append("|-----|----|----|----|----|----|----|----|----|----|\n")
             
             for app_name, metrics in evaluation_results.items():
                 gt = metrics.get("ground_truth", 0)
                 v1 = metrics.get("ilea_v1", {})
                 v2 = metrics.get("ilea_v2", {})
                 
-                report += f"| {app_name} | {gt} | "
-                report += f"{v1.get('detected', 0)} | "
-                report += f"{v1.get('precision', 0):.2f} | "
-                report += f"{v1.get('recall', 0):.2f} | "
-                report += f"{v1.get('f1', 0):.2f} | "
-                report += f"{v2.get('detected', 0)} | "
-                report += f"{v2.get('precision', 0):.2f} | "
-                report += f"{v2.get('recall', 0):.2f} | "
-                report += f"{v2.get('f1', 0):.2f} |\n"
+                parts.append(
+                    f"| {app_name} | {gt} | "
+                    f"{v1.get('detected', 0)} | "
+                    f"{v1.get('precision', 0):.2f} | "
+                    f"{v1.get('recall', 0):.2f} | "
+                    f"{v1.get('f1', 0):.2f} | "
+                    f"{v2.get('detected', 0)} | "
+                    f"{v2.get('precision', 0):.2f} | "
+                    f"{v2.get('recall', 0):.2f} | "
+                    f"{v2.get('f1', 0):.2f} |\n"
+                )
         
         # Add app scores
         if app_scores:
-            report += "\n## Application Security Posture\n\n"
-            report += "| App | Findings | Avg Conf | Sophistication | Tier |\n"
-            report += "|-----|----------|----------|---|---|\n"
+            parts.append("\n## Application Security Posture\n\n")
+            parts.append("| App | Findings | Avg Conf | Sophistication | Tier |\n")
+            parts.append("|-----|----------|----------|---|---|\n")
             
             for score in app_scores:
-                report += f"| {score.app_name} | {score.total_findings} | "
-                report += f"{score.avg_confidence:.2f} | "
-                report += f"{score.sophistication_score:.2f} | "
-                report += f"{score.overall_tier} |\n"
+                parts.append(
+                    f"| {score.app_name} | {score.total_findings} | "
+                    f"{score.avg_confidence:.2f} | "
+                    f"{score.sophistication_score:.2f} | "
+                    f"{score.overall_tier} |\n"
+                )
         
         # Add vulnerability info
         if vulnerabilities_found > 0:
-            report += f"\n## Vulnerability Analysis\n\n"
-            report += f"**Total Vulnerabilities Detected**: {vulnerabilities_found}\n\n"
+            parts.append(f"\n## Vulnerability Analysis\n\n")
+            parts.append(f"**Total Vulnerabilities Detected**: {vulnerabilities_found}\n\n")
         
-        return report
+        return "".join(parts)
@@ -19,7 +19,8 @@ class SmaliGenericEvidenceSlicer:
         start = max(0, idx - self.CONTEXT_BEFORE)
         end = min(len(smali_lines), idx + self.CONTEXT_AFTER)
 
-        evidence = smali_lines[start:end]
+        # rstrip each window line once; enforcement detection reuses it
+        evidence = [l.rstrip() for l in smali_lines[start:end]]
 
         trigger = smali_lines[idx].strip()
 
@@ -32,12 +33,12 @@ class SmaliGenericEvidenceSlicer:
             decision_type=decision.decision_type,
             enforcement_type=enforcement,
             trigger_instruction=trigger,
-            evidence_lines=[l.rstrip() for l in evidence],
+            evidence_lines=evidence,
         )
 
     def _infer_enforcement(self, lines: List[str]) -> str:
         for l in lines:
-            l = l.strip()
+            l = l.lstrip()
             if l.startswith("throw"):
                 return "throw"
             if l.startswith("return"):
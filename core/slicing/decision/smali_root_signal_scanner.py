@@ -1,4 +1,7 @@
-from typing import List
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Tuple
 from core.strategy.models import RootSignal
 
 
@@ -61,6 +64,16 @@ class SmaliRootSignalScanner:
         "selinux_state_query": 0.7,
     }
 
+    # One alternation over every keyword: lets a method body (or line)
+    # with no root indicator be rejected in a single regex pass
+    _ANY_SIGNAL_RE = re.compile(
+        "|".join(
+            re.escape(k)
+            for keywords in SIGNALS.values()
+            for k in keywords
+        )
+    )
+
     def scan(
         self,
         smali_lines: List[str],
@@ -70,26 +83,74 @@ class SmaliRootSignalScanner:
         """
         Scan a single method body for root-related signals.
         """
+        return self.build_signals(
+            self.match_indicators(smali_lines),
+            class_name=class_name,
+            method_name=method_name,
+        )
+
+    def match_indicators(self, smali_lines: List[str]) -> List[Tuple[str, str]]:
+        """
+        (signal_type, keyword) hits in line order.
+        Independent of class/method, so callers may reuse it
+        for every decision located in the same file.
+        """
+
+        hits: List[Tuple[str, str]] = []
+
+        any_signal = self._ANY_SIGNAL_RE.search
+        lowered = "\n".join(smali_lines).lower()
+        m = any_signal(lowered)
+        if m is None:
+            return hits
+
+        ends = list(accumulate(len(l) + 1 for l in smali_lines))
+        if len(lowered) != ends[-1] - 1:
+            # a character grew when lowered: offsets no longer line up
+            return self._match_lines(smali_lines, hits)
+
+        # one regex pass over the lowered file jumps from matching line
+        # to matching line; the rest of the file is never visited
+        while m is not None:
+            i = bisect_right(ends, m.start())
+            start = ends[i] - len(smali_lines[i]) - 1
+            self._match_line(lowered[start:ends[i] - 1], hits)
+            m = any_signal(lowered, ends[i])
 
-        signals: List[RootSignal] = []
+        return hits
+
+    def _match_lines(
+        self, smali_lines: List[str], hits: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        any_signal = self._ANY_SIGNAL_RE.search
 
         for line in smali_lines:
             l = line.lower()
+            if any_signal(l):
+                self._match_line(l, hits)
+
+        return hits
 
-            for signal_type, keywords in self.SIGNALS.items():
-                for keyword in keywords:
-                    if keyword in l:
-                        signals.append(
-                            RootSignal(
-                                category="ROOT_DETECTION",
-                                signal_type=signal_type,
-                                indicator=keyword,
-                                class_name=class_name,
-                                method_name=method_name,
-                                confidence=self.SIGNAL_CONFIDENCE.get(
-                                    signal_type, 0.6
-                                ),
-                            )
-                        )
-
-        return signals
+    def _match_line(self, l: str, hits: List[Tuple[str, str]]):
+        for signal_type, keywords in self.SIGNALS.items():
+            for keyword in keywords:
+                if keyword in l:
+                    hits.append((signal_type, keyword))
+
+    def build_signals(
+        self,
+        hits: List[Tuple[str, str]],
+        class_name: str,
+        method_name: str,
+    ) -> List[RootSignal]:
+        return [
+            RootSignal(
+                category="ROOT_DETECTION",
+                signal_type=signal_type,
+                indicator=keyword,
+                class_name=class_name,
+                method_name=method_name,
+                confidence=self.SIGNAL_CONFIDENCE.get(signal_type, 0.6),
+            )
+            for signal_type, keyword in hits
+        ]
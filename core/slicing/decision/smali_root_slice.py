@@ -1,3 +1,4 @@
+import re
 from typing import List
 from core.decision.models import DecisionEvidenceSlice
 
@@ -25,19 +26,26 @@ class SmaliRootEvidenceSlicer:
         "/proc/",
     )
 
+    EVIDENCE_OPCODES = ("if-", "invoke-", "const-string")
+
+    _ROOT_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in ROOT_KEYWORDS))
+
+    def __init__(self):
+        # per-line evidence test, memoized for the file being sliced:
+        # adjacent decisions have overlapping windows
+        self._memo_lines = None
+        self._memo = {}
+
     def slice(self, decision, smali_lines: List[str]) -> DecisionEvidenceSlice:
         idx = decision.instruction_index
 
         start = max(0, idx - self.CONTEXT_BEFORE)
         end = min(len(smali_lines), idx + self.CONTEXT_AFTER)
 
-        window = smali_lines[start:end]
-
         evidence = [
-            l.rstrip()
-            for l in window
-            if any(k in l.lower() for k in self.ROOT_KEYWORDS)
-            or l.strip().startswith(("if-", "invoke-", "const-string"))
+            smali_lines[i].rstrip()
+            for i in range(start, end)
+            if self._is_evidence_line(smali_lines, i)
         ]
 
         trigger = smali_lines[idx].strip()
@@ -51,3 +59,21 @@ class SmaliRootEvidenceSlicer:
             trigger_instruction=trigger,
             evidence_lines=evidence,
         )
+
+    def _is_evidence_line(self, smali_lines: List[str], i: int) -> bool:
+        if smali_lines is not self._memo_lines:
+            self._memo_lines = smali_lines
+            self._memo = {}
+
+        hit = self._memo.get(i)
+        if hit is None:
+            l = smali_lines[i]
+            # opcode prefix first: it settles most evidence lines
+            # without lowering them for the keyword search
+            hit = (
+                l.lstrip().startswith(self.EVIDENCE_OPCODES)
+                or self._ROOT_KEYWORD_RE.search(l.lower()) is not None
+            )
+            self._memo[i] = hit
+
+        return hit
@@ -19,26 +19,51 @@ class SmaliSSLPinningEvidenceSlicer:
     )
 
     def slice(self, decision, smali_lines: List[str]) -> DecisionEvidenceSlice:
-        idx = decision.instruction_index
+        return self.slice_batch([decision], smali_lines)[0]
 
-        start = max(0, idx - self.CONTEXT_BEFORE)
-        end = min(len(smali_lines), idx + self.CONTEXT_AFTER)
+    def slice_batch(
+        self, decisions, smali_lines: List[str]
+    ) -> List[DecisionEvidenceSlice]:
+        """
+        Slice every decision of ONE file.
+        Decisions sharing a window (e.g. enforcement + abort on the
+        same if-*) reuse its stripped lines and enforcement type.
+        """
+        windows = {}
+        slices: List[DecisionEvidenceSlice] = []
 
-        evidence = smali_lines[start:end]
+        for decision in decisions:
+            idx = decision.instruction_index
 
-        enforcement = self._detect_enforcement(evidence)
+            start = max(0, idx - self.CONTEXT_BEFORE)
+            end = min(len(smali_lines), idx + self.CONTEXT_AFTER)
 
-        trigger = smali_lines[decision.instruction_index].strip()
+            window = windows.get((start, end))
+            if window is None:
+                evidence = smali_lines[start:end]
+                window = (
+                    self._detect_enforcement(evidence),
+                    [l.rstrip() for l in evidence],
+                )
+                windows[(start, end)] = window
 
-        return DecisionEvidenceSlice(
-            language="smali",
-            class_name=decision.class_name,
-            method_name=decision.method_name,
-            decision_type=decision.decision_type,
-            enforcement_type=enforcement,
-            trigger_instruction=trigger,
-            evidence_lines=[l.rstrip() for l in evidence],
-        )
+            enforcement, evidence_lines = window
+
+            trigger = smali_lines[decision.instruction_index].strip()
+
+            slices.append(
+                DecisionEvidenceSlice(
+                    language="smali",
+                    class_name=decision.class_name,
+                    method_name=decision.method_name,
+                    decision_type=decision.decision_type,
+                    enforcement_type=enforcement,
+                    trigger_instruction=trigger,
+                    evidence_lines=list(evidence_lines),
+                )
+            )
+
+        return slices
 
 
     def _detect_enforcement(self, lines: List[str]) -> str:
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import List
+from typing import Iterable
 
 from core.strategy.models import ProtectionStrategy
 
@@ -10,7 +10,7 @@ class StrategyAggregator:
     into per-app security posture.
     """
 
-    def aggregate(self, strategies: List[ProtectionStrategy]):
+    def aggregate(self, strategies: Iterable[ProtectionStrategy]):
         """
         Output format:
         {
@@ -26,13 +26,10 @@ class StrategyAggregator:
 
         summary = {}
 
-        if not strategies:
-            return summary
-
         grouped = defaultdict(list)
 
         # -------------------------
-        # Group by category
+        # Group by category (single pass: any iterable)
         # -------------------------
         for s in strategies:
             grouped[s.category].append(s)
@@ -50,7 +47,7 @@ class StrategyAggregator:
             for s in items:
                 subtypes.add(s.subtype)
                 confidences.append(s.confidence)
-                evidence_count += getattr(s, "evidence_count", 1)
+                evidence_count += s.evidence_count
 
                 if s.technique:
                     techniques.add(s.technique)
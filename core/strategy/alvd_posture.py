@@ -16,9 +16,8 @@ class ALVDPostureAnalyzer:
     }
 
     def analyze(self, signals: Dict[str, int]) -> Dict:
-        signal_score = 0
-        for k, v in signals.items():
-            signal_score += v * self.SIGNAL_WEIGHTS.get(k, 1)
+        weights = self.SIGNAL_WEIGHTS
+        signal_score = sum(v * weights.get(k, 1) for k, v in signals.items())
 
         posture = self._classify(signal_score)
 
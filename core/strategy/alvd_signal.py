@@ -2,6 +2,9 @@
 
 from typing import Dict
 import os
+import re
+
+from core.strategy.smali_stream import iter_keyword_lines
 
 
 class ALVDSignalScanner:
@@ -40,9 +43,28 @@ class ALVDSignalScanner:
         ],
     }
 
+    # compiled once: one alternation per category + one over all keywords.
+    # Lines are lowered before matching, so the keywords are lowered here
+    # once as well ("userId" could never match otherwise)
+    _SIGNAL_PATTERNS = {
+        category: re.compile("|".join(re.escape(k.lower()) for k in keywords))
+        for category, keywords in ALVD_KEYWORDS.items()
+    }
+
+    _ANY_SIGNAL_RE = re.compile(
+        "|".join(
+            re.escape(k.lower())
+            for keywords in ALVD_KEYWORDS.values()
+            for k in keywords
+        )
+    )
+
     def scan(self, smali_root: str) -> Dict[str, int]:
         summary = {}
 
+        any_signal = self._ANY_SIGNAL_RE.search
+        signal_patterns = self._SIGNAL_PATTERNS.items()
+
         for root, _, files in os.walk(smali_root):
             for f in files:
                 if not f.endswith(".smali"):
@@ -50,15 +72,11 @@ class ALVDSignalScanner:
 
                 path = os.path.join(root, f)
                 try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
+                    for l in iter_keyword_lines(path, any_signal):
+                        for category, pattern in signal_patterns:
+                            if pattern.search(l):
+                                summary[category] = summary.get(category, 0) + 1
                 except Exception:
                     continue
 
-                for line in lines:
-                    l = line.lower()
-                    for category, keys in self.ALVD_KEYWORDS.items():
-                        if any(k in l for k in keys):
-                            summary[category] = summary.get(category, 0) + 1
-
         return summary
@@ -1,3 +1,4 @@
+import re
 from typing import Optional
 from core.decision.models import DecisionEvidenceSlice
 from core.strategy.models import ProtectionStrategy
@@ -41,71 +42,48 @@ class AntiInstrumentationStrategyInferer:
         "issystemdebuggable",
     ]
 
+    # (hints, subtype, confidence) in priority order: the first table
+    # with a hit in the blob decides the subtype
+    HINT_TABLES = (
+        (DEBUGGER_HINTS, "Debugger Detection", 0.85),
+        (PTRACE_HINTS, "Ptrace Detection", 0.9),
+        (PROC_TRACE_HINTS, "TracerPid Check", 0.8),
+        (FRIDA_HINTS, "Hook Framework Detection", 0.95),
+    )
+
+    _ANY_HINT_RE = re.compile(
+        "|".join(re.escape(h) for hints, _, _ in HINT_TABLES for h in hints)
+    )
+
+    ACTIVE_ENFORCEMENT_TYPES = frozenset(("throw", "abort", "exit"))
+
     def infer(
-        self, evidence: DecisionEvidenceSlice
+        self,
+        evidence: DecisionEvidenceSlice,
+        blob: Optional[str] = None,
     ) -> Optional[ProtectionStrategy]:
 
-        blob = (
-            f"{evidence.class_name} "
-            f"{evidence.method_name} "
-            f"{' '.join(evidence.evidence_lines)}"
-        ).lower()
+        # blob may be precomputed once per slice by StrategyPipeline
+        if blob is None:
+            blob = evidence.search_blob()
+
+        # most slices carry no hint from any table
+        if not self._ANY_HINT_RE.search(blob):
+            return None
 
-        subtype = None
         mode = "PASSIVE_DETECTION"
-        confidence = 0.55
-        detail = None
 
-        # -------------------------
-        # Debugger detection
-        # -------------------------
-        for h in self.DEBUGGER_HINTS:
-            if h in blob:
-                subtype = "Debugger Detection"
-                detail = h
-                confidence = 0.85
+        for hints, subtype, confidence in self.HINT_TABLES:
+            detail = next((h for h in hints if h in blob), None)
+            if detail:
                 break
-
-        # -------------------------
-        # ptrace
-        # -------------------------
-        if not subtype:
-            for h in self.PTRACE_HINTS:
-                if h in blob:
-                    subtype = "Ptrace Detection"
-                    detail = h
-                    confidence = 0.9
-                    break
-
-        # -------------------------
-        # TracerPid
-        # -------------------------
-        if not subtype:
-            for h in self.PROC_TRACE_HINTS:
-                if h in blob:
-                    subtype = "TracerPid Check"
-                    detail = h
-                    confidence = 0.8
-                    break
-
-        # -------------------------
-        # Frida / Hook
-        # -------------------------
-        if not subtype:
-            for h in self.FRIDA_HINTS:
-                if h in blob:
-                    subtype = "Hook Framework Detection"
-                    detail = h
-                    confidence = 0.95
-                    break
-
-        if not subtype:
+        else:
             return None
 
         # -------------------------
         # Enforcement vs Passive
         # -------------------------
-        if evidence.enforcement_type in ["throw", "abort", "exit"]:
+        if evidence.enforcement_type in self.ACTIVE_ENFORCEMENT_TYPES:
             mode = "ACTIVE_ENFORCEMENT"
             confidence += 0.1
 
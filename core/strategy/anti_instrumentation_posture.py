@@ -27,6 +27,13 @@ class AntiInstrumentationPostureAnalyzer:
         "process_termination": 3,
     }
 
+    # style buckets, as sets so each test is a hash lookup
+    ACTIVE_SIGNALS = frozenset({"frida_artifact", "ptrace_check"})
+    PASSIVE_SIGNALS = frozenset(
+        {"timing_check", "debugger_check", "proc_tracerpid"}
+    )
+    ENFORCING_DECISIONS = frozenset({"process_termination"})
+
     def analyze(
         self,
         signal_freq: Dict[str, int],
@@ -56,17 +63,14 @@ class AntiInstrumentationPostureAnalyzer:
     # ------------------------
 
     def _score_signals(self, freq: Dict[str, int]) -> int:
-        score = 0
-        for signal, count in freq.items():
-            weight = self.SIGNAL_WEIGHTS.get(signal, 0)
-            score += weight * count
-        return score
+        weights = self.SIGNAL_WEIGHTS
+        return sum(
+            weights.get(signal, 0) * count for signal, count in freq.items()
+        )
 
     def _score_decisions(self, decisions: List[str]) -> int:
-        score = 0
-        for d in decisions:
-            score += self.DECISION_WEIGHTS.get(d, 0)
-        return score
+        weights = self.DECISION_WEIGHTS
+        return sum(weights.get(d, 0) for d in decisions)
 
     def _posture_level(self, score: int) -> str:
         if score > 15:
@@ -81,20 +85,9 @@ class AntiInstrumentationPostureAnalyzer:
         decision_types: List[str],
     ) -> str:
 
-        active = any(
-            s in signal_freq
-            for s in ["frida_artifact", "ptrace_check"]
-        )
-
-        passive = any(
-            s in signal_freq
-            for s in ["timing_check", "debugger_check", "proc_tracerpid"]
-        )
-
-        enforcement = any(
-            d in ["process_termination"]
-            for d in decision_types
-        )
+        active = not self.ACTIVE_SIGNALS.isdisjoint(signal_freq)
+        passive = not self.PASSIVE_SIGNALS.isdisjoint(signal_freq)
+        enforcement = not self.ENFORCING_DECISIONS.isdisjoint(decision_types)
 
         styles = []
 
@@ -1,3 +1,5 @@
+import os
+import re
 from collections import defaultdict
 from typing import Dict, List
 
@@ -48,14 +50,22 @@ class AntiInstrumentationSignalScanner:
         ],
     }
 
+    # compiled once: one alternation per signal + one over all keywords
+    _SIGNAL_PATTERNS = {
+        signal: re.compile("|".join(re.escape(k) for k in keywords))
+        for signal, keywords in SIGNALS.items()
+    }
+
+    _ANY_SIGNAL_RE = re.compile(
+        "|".join(re.escape(k) for keywords in SIGNALS.values() for k in keywords)
+    )
+
     def scan_smali_dir(self, smali_root: str) -> Dict[str, int]:
         """
         Scan smali files for anti-instrumentation signals.
         """
         signals = defaultdict(int)
 
-        import os
-
         for root, _, files in os.walk(smali_root):
             for f in files:
                 if not f.endswith(".smali"):
@@ -64,20 +74,29 @@ class AntiInstrumentationSignalScanner:
                 path = os.path.join(root, f)
                 try:
                     with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
+                        text = fh.read()
                 except Exception:
                     continue
 
-                self._scan_lines(lines, signals)
+                # whole-file reject before any per-line work; the
+                # lowered text is split as-is, so no line is lowered twice
+                lowered = text.lower()
+                if not self._ANY_SIGNAL_RE.search(lowered):
+                    continue
+
+                self._scan_lines(lowered.split("\n"), signals)
 
         return dict(signals)
 
     # --------------------------------------------------
 
-    def _scan_lines(self, lines: List[str], signals: Dict[str, int]):
-        for line in lines:
-            l = line.lower()
+    def _scan_lines(self, lowered_lines: List[str], signals: Dict[str, int]):
+        any_signal = self._ANY_SIGNAL_RE.search
+
+        for l in lowered_lines:
+            if not any_signal(l):
+                continue
 
-            for signal, keywords in self.SIGNALS.items():
-                if any(k in l for k in keywords):
+            for signal, pattern in self._SIGNAL_PATTERNS.items():
+                if pattern.search(l):
                     signals[signal] += 1
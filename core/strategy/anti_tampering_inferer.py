@@ -1,5 +1,6 @@
 # core/strategy/anti_tampering_inferer.py
 
+import re
 from typing import Optional
 from core.decision.models import DecisionEvidenceSlice
 from core.strategy.models import ProtectionStrategy
@@ -37,17 +38,29 @@ class AntiTamperingStrategyInferer:
         "getinstallerpackagename": "Installer Verification",
     }
 
+    # union gate: most slices carry none of the keywords
+    _ANY_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in TECHNIQUE_MAP))
+
+    # boost per enforcing decision_type; signal-only slices get none
+    DECISION_BOOST = {
+        "throw_exception": 0.3,
+        "conditional_abort": 0.2,
+    }
+
     def infer(
         self,
-        evidence: DecisionEvidenceSlice
+        evidence: DecisionEvidenceSlice,
+        blob: Optional[str] = None,
     ) -> Optional[ProtectionStrategy]:
 
-        blob = (
-            f"{evidence.class_name} "
-            f"{evidence.method_name} "
-            f"{' '.join(evidence.evidence_lines)} "
-            f"{evidence.trigger_instruction}"
-        ).lower()
+        # the slice's shared search blob (lowered once per slice by
+        # StrategyPipeline) plus the lowered trigger instruction
+        if blob is None:
+            blob = evidence.search_blob()
+        blob = f"{blob} {evidence.trigger_instruction.lower()}"
+
+        if not self._ANY_KEYWORD_RE.search(blob):
+            return None
 
         detected_techniques = set()
 
@@ -67,10 +80,7 @@ class AntiTamperingStrategyInferer:
         confidence = 0.4  # base: signal-only protection
 
         # enforcement evidence boosts confidence
-        if evidence.decision_type == "throw_exception":
-            confidence += 0.3
-        elif evidence.decision_type == "conditional_abort":
-            confidence += 0.2
+        confidence += self.DECISION_BOOST.get(evidence.decision_type, 0.0)
 
         # richer evidence window
         if len(evidence.evidence_lines) >= 4:
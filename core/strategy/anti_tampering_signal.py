@@ -1,5 +1,8 @@
 from typing import Dict
 import os
+import re
+
+from core.strategy.smali_stream import iter_keyword_lines
 
 
 class AntiTamperingSignalScanner:
@@ -41,9 +44,22 @@ class AntiTamperingSignalScanner:
         ],
     }
 
+    # compiled once: one alternation per cat + one over all keywords
+    _SIGNAL_PATTERNS = {
+        cat: re.compile("|".join(re.escape(k) for k in keywords))
+        for cat, keywords in SIGNAL_KEYWORDS.items()
+    }
+
+    _ANY_SIGNAL_RE = re.compile(
+        "|".join(re.escape(k) for keywords in SIGNAL_KEYWORDS.values() for k in keywords)
+    )
+
     def scan(self, smali_root: str) -> Dict[str, int]:
         summary = {}
 
+        any_signal = self._ANY_SIGNAL_RE.search
+        signal_patterns = self._SIGNAL_PATTERNS.items()
+
         for root, _, files in os.walk(smali_root):
             for f in files:
                 if not f.endswith(".smali"):
@@ -51,15 +67,11 @@ class AntiTamperingSignalScanner:
 
                 path = os.path.join(root, f)
                 try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
+                    for l in iter_keyword_lines(path, any_signal):
+                        for cat, pattern in signal_patterns:
+                            if pattern.search(l):
+                                summary[cat] = summary.get(cat, 0) + 1
                 except Exception:
                     continue
 
-                for line in lines:
-                    l = line.lower()
-                    for cat, keys in self.SIGNAL_KEYWORDS.items():
-                        if any(k in l for k in keys):
-                            summary[cat] = summary.get(cat, 0) + 1
-
         return summary
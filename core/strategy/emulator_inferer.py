@@ -1,3 +1,4 @@
+import re
 from typing import Optional
 from core.decision.models import DecisionEvidenceSlice
 from core.strategy.models import ProtectionStrategy
@@ -30,16 +31,29 @@ class EmulatorDetectionStrategyInferer:
         "test-keys": "Test-Keys Build",
     }
 
+    # one alternation over both tables: a slice with no indicator at all
+    # is rejected in a single pass before the ordered lookups below
+    _ANY_INDICATOR_RE = re.compile(
+        "|".join(
+            re.escape(k)
+            for table in (EMULATOR_ARTIFACTS, BUILD_PROPERTIES)
+            for k in table
+        )
+    )
+
     def infer(
-        self, evidence: DecisionEvidenceSlice
+        self,
+        evidence: DecisionEvidenceSlice,
+        blob: Optional[str] = None,
     ) -> Optional[ProtectionStrategy]:
 
-        blob = (
-            f"{evidence.class_name} "
-            f"{evidence.method_name} "
-            f"{' '.join(evidence.evidence_lines)}"
-        ).lower()
+        if blob is None:
+            blob = evidence.search_blob()
+
+        if not self._ANY_INDICATOR_RE.search(blob):
+            return None
 
+        # table order decides which mechanism wins
         mechanism = None
 
         # --- Artifact-based detection ---
@@ -24,6 +24,11 @@ class EmulatorDetectionPostureAnalyzer:
         "emulator_pipe": 7,
     }
 
+    # signals that probe the runtime rather than static build values
+    RUNTIME_SIGNALS = frozenset(
+        {"qemu_property", "emulator_pipe", "goldfish_driver"}
+    )
+
     DECISION_WEIGHT = 5
     TERMINATION_BONUS = 8
 
@@ -62,11 +67,10 @@ class EmulatorDetectionPostureAnalyzer:
     # Internal helpers
     # -------------------------
     def _score_signals(self, signals: Dict[str, int]) -> int:
-        score = 0
-        for sig, count in signals.items():
-            weight = self.SIGNAL_WEIGHTS.get(sig, 1)
-            score += count * weight
-        return score
+        weights = self.SIGNAL_WEIGHTS
+        return sum(
+            count * weights.get(sig, 1) for sig, count in signals.items()
+        )
 
     def _classify_posture(self, score: int) -> str:
         if score >= 40:
@@ -81,10 +85,7 @@ class EmulatorDetectionPostureAnalyzer:
         self, signals: Dict[str, int], decision_count: int
     ) -> str:
 
-        has_runtime = any(
-            k in signals
-            for k in ["qemu_property", "emulator_pipe", "goldfish_driver"]
-        )
+        has_runtime = not self.RUNTIME_SIGNALS.isdisjoint(signals)
 
         if decision_count > 0 and has_runtime:
             return "ACTIVE"
@@ -2,6 +2,9 @@
 
 from typing import Dict
 import os
+import re
+
+from core.strategy.smali_stream import iter_keyword_lines
 
 
 class EmulatorSignalScanner:
@@ -57,12 +60,25 @@ class EmulatorSignalScanner:
         ],
     }
 
+    # compiled once: one alternation per signal + one over all keywords
+    _SIGNAL_PATTERNS = {
+        signal: re.compile("|".join(re.escape(k) for k in keywords))
+        for signal, keywords in SIGNALS.items()
+    }
+
+    _ANY_SIGNAL_RE = re.compile(
+        "|".join(re.escape(k) for keywords in SIGNALS.values() for k in keywords)
+    )
+
     def scan_smali_dir(self, smali_root: str) -> Dict[str, int]:
         """
         Scan smali files for emulator detection signals.
         """
         signals = {}
 
+        any_signal = self._ANY_SIGNAL_RE.search
+        signal_patterns = self._SIGNAL_PATTERNS.items()
+
         for root, _, files in os.walk(smali_root):
             for f in files:
                 if not f.endswith(".smali"):
@@ -70,16 +86,11 @@ class EmulatorSignalScanner:
 
                 path = os.path.join(root, f)
                 try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
+                    for l in iter_keyword_lines(path, any_signal):
+                        for signal_type, pattern in signal_patterns:
+                            if pattern.search(l):
+                                signals[signal_type] = signals.get(signal_type, 0) + 1
                 except Exception:
                     continue
 
-                for line in lines:
-                    l = line.lower()
-
-                    for signal_type, keywords in self.SIGNALS.items():
-                        if any(k in l for k in keywords):
-                            signals[signal_type] = signals.get(signal_type, 0) + 1
-
         return signals
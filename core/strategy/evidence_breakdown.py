@@ -25,7 +25,7 @@ class EvidenceBreakdownBuilder:
     """
 
     def build(self, strategies, evidences):
-        tree: Dict[str, CategoryNode] = {}
+        tree: Dict[str, CategoryNode] = defaultdict(CategoryNode)
 
         for strat, ev in zip(strategies, evidences):
 
@@ -33,17 +33,18 @@ class EvidenceBreakdownBuilder:
             sub = strat.subtype
             mech = ev.technique or "unknown"
 
-            if cat not in tree:
-                tree[cat] = CategoryNode()
+            # one lookup per level instead of re-walking tree[cat]...
+            subtypes = tree[cat].subtypes
+            sub_node = subtypes.get(sub)
+            if sub_node is None:
+                sub_node = subtypes[sub] = SubtypeNode()
 
-            if sub not in tree[cat].subtypes:
-                tree[cat].subtypes[sub] = SubtypeNode()
+            mechanisms = sub_node.mechanisms
+            node = mechanisms.get(mech)
+            if node is None:
+                node = mechanisms[mech] = MechanismNode()
 
-            if mech not in tree[cat].subtypes[sub].mechanisms:
-                tree[cat].subtypes[sub].mechanisms[mech] = MechanismNode()
-
-            node = tree[cat].subtypes[sub].mechanisms[mech]
             node.evidences.append(ev)
             node.occurrence_count += 1
 
-        return tree
+        return dict(tree)
@@ -39,6 +39,16 @@ class AntiTamperingEvidenceBreakdownBuilderV2:
     - Signal-based evidence → signal
     """
 
+    # built once with the class rather than on every build() call
+    SIGNAL_TO_SUBTYPE = {
+        "package_name_check": "Package Name Integrity",
+        "debuggable_flag": "Debuggable Flag Check",
+        "signature_check": "Signature Verification",
+        "dex_checksum": "Code Integrity Verification",
+        "asset_integrity": "Asset Integrity Protection",
+        "installer_check": "Installer Verification",
+    }
+
     def build(
         self,
         strategies: List[ProtectionStrategy],
@@ -70,17 +80,8 @@ class AntiTamperingEvidenceBreakdownBuilderV2:
         # -------------------------
         # Signal-only evidence
         # -------------------------
-        SIGNAL_TO_SUBTYPE = {
-            "package_name_check": "Package Name Integrity",
-            "debuggable_flag": "Debuggable Flag Check",
-            "signature_check": "Signature Verification",
-            "dex_checksum": "Code Integrity Verification",
-            "asset_integrity": "Asset Integrity Protection",
-            "installer_check": "Installer Verification",
-        }
-
         for signal, count in signal_summary.items():
-            subtype = SIGNAL_TO_SUBTYPE.get(signal)
+            subtype = self.SIGNAL_TO_SUBTYPE.get(signal)
             if not subtype:
                 continue
 
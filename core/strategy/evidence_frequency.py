@@ -1,4 +1,5 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import attrgetter
 
 
 class EvidenceFrequencyAnalyzer:
@@ -14,12 +15,18 @@ class EvidenceFrequencyAnalyzer:
         })
 
         # asumsi: 1 strategy ↔ 1 evidence (pipeline kamu sudah begitu)
-        for strat, ev in zip(strategies, evidences):
+        # pairs are tallied by Counter's C loop; keys are then formatted
+        # once per distinct pair instead of once per strategy
+        pairs = Counter(zip(
+            map(attrgetter("technique"), strategies),
+            map(attrgetter("decision_type"), evidences),
+        ))
 
-            technique = strat.technique or "unknown"
-            key = f"{technique}:{ev.decision_type}"
+        for (technique, decision_type), n in pairs.items():
+            technique = technique or "unknown"
+            key = f"{technique}:{decision_type}"
 
-            freq[key]["count"] += 1
-            freq[key]["techniques"][technique] += 1
+            freq[key]["count"] += n
+            freq[key]["techniques"][technique] += n
 
         return freq
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtectionStrategy:
     category: str
     subtype: str
@@ -16,7 +16,7 @@ class ProtectionStrategy:
 
     evidence_summary: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class RootSignal:
     category: str
     signal_type: str
@@ -8,15 +8,18 @@ class RootDetectionStrategyInferer:
     Converts RootSignal → ProtectionStrategy
     """
 
-    def infer(self, signals: List[RootSignal]) -> List[ProtectionStrategy]:
-        strategies = []
-
-        for signal in signals:
-            strategy = self._infer_from_signal(signal)
-            if strategy:
-                strategies.append(strategy)
+    # signal_type → strategy subtype (unmapped types yield no strategy)
+    SUBTYPE_MAP = {
+        "magisk_artifact": "Magisk Artifact Detection",
+        "file_existence_check": "SU Binary Presence Check",
+        "runtime_exec_check": "Runtime Command Execution Check",
+        "build_property_check": "Build Tags Inspection",
+        "selinux_state_query": "SELinux Enforcement Check",
+    }
 
-        return strategies
+    def infer(self, signals: List[RootSignal]) -> List[ProtectionStrategy]:
+        # batch entry point: one call maps the whole signal list
+        return [s for s in map(self._infer_from_signal, signals) if s]
 
     def infer_from_signal(self, signal: RootSignal):
         """Public method to infer strategy from a single signal"""
@@ -25,15 +28,7 @@ class RootDetectionStrategyInferer:
     # ------------------------------------
 
     def _infer_from_signal(self, signal: RootSignal):
-        subtype_map = {
-            "magisk_artifact": "Magisk Artifact Detection",
-            "file_existence_check": "SU Binary Presence Check",
-            "runtime_exec_check": "Runtime Command Execution Check",
-            "build_property_check": "Build Tags Inspection",
-            "selinux_state_query": "SELinux Enforcement Check",
-        }
-
-        subtype = subtype_map.get(signal.signal_type)
+        subtype = self.SUBTYPE_MAP.get(signal.signal_type)
         if not subtype:
             return None
 
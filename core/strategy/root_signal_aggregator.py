@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import Counter
 from core.strategy.models import RootSignal
 
 
@@ -8,10 +8,10 @@ class RootSignalAggregator:
     """
 
     def aggregate(self, signals: list[RootSignal]):
-        summary = defaultdict(int)
+        # count on (type, indicator) tuples; format the key once per pair
+        summary = Counter((s.signal_type, s.indicator) for s in signals)
 
-        for s in signals:
-            key = f"{s.signal_type}:{s.indicator}"
-            summary[key] += 1
-
-        return dict(sorted(summary.items(), key=lambda x: x[1], reverse=True))
+        return {
+            f"{signal_type}:{indicator}": count
+            for (signal_type, indicator), count in summary.most_common()
+        }
@@ -0,0 +1,34 @@
+# core/strategy/smali_stream.py
+
+from typing import Callable, Iterator, Optional
+
+# lines are read in blocks of roughly this many characters: peak memory
+# stays bounded by one block instead of the whole file
+BLOCK_HINT = 1 << 16
+
+
+def iter_keyword_lines(
+    path: str,
+    search: Callable[[str], Optional[object]],
+    block_hint: int = BLOCK_HINT,
+) -> Iterator[str]:
+    """
+    Stream the lowered lines of a smali file on which `search` hits.
+
+    Whole lines are read a block at a time; a block is lowered once and
+    searched once, so keyword-free stretches (most files) never reach
+    per-line work. Errors propagate like open().
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+        while True:
+            lines = fh.readlines(block_hint)
+            if not lines:
+                return
+
+            block = "".join(lines).lower()
+            if not search(block):
+                continue
+
+            for l in block.split("\n"):
+                if search(l):
+                    yield l
@@ -1,3 +1,4 @@
+import re
 from typing import Optional
 from core.decision.models import DecisionEvidenceSlice
 from core.strategy.models import ProtectionStrategy
@@ -44,26 +45,44 @@ class SSLPinningStrategyInferer:
         "intrinsics",
     ]
 
+    # keyword tables compiled once at class load
+    _SSL_RE = re.compile("|".join(re.escape(k) for k in SSL_KEYWORDS))
+    _PINNING_RE = re.compile("|".join(re.escape(k) for k in PINNING_SEMANTICS))
+    _NON_PINNING_RE = re.compile(
+        "|".join(re.escape(k) for k in NON_PINNING_HINTS)
+    )
+
+    # enforcement_type → confidence boost (other types: none)
+    ENFORCEMENT_BOOST = {
+        "throw": 0.30,
+        "return": 0.20,
+        "abort": 0.15,
+    }
+
+    STRONG_SUBTYPES = frozenset(("TrustManager Pinning", "Hostname Verification"))
+
     # ----------------------------------------------------
 
     def infer(
-        self, evidence: DecisionEvidenceSlice
+        self,
+        evidence: DecisionEvidenceSlice,
+        blob: Optional[str] = None,
     ) -> Optional[ProtectionStrategy]:
 
-        blob = (
-            f"{evidence.class_name} "
-            f"{evidence.method_name} "
-            f"{' '.join(evidence.evidence_lines)}"
-        ).lower()
+        # blob may be precomputed once per slice by StrategyPipeline
+        if blob is None:
+            blob = evidence.search_blob()
 
         # ❌ Not SSL-related at all
-        if not any(k in blob for k in self.SSL_KEYWORDS):
+        if not self._SSL_RE.search(blob):
             return None
 
         # ❌ Explicit non-security guards
-        if any(k in blob for k in self.NON_PINNING_HINTS):
+        if self._NON_PINNING_RE.search(blob):
             return None
 
+        has_pinning = self._PINNING_RE.search(blob) is not None
+
         # ------------------------------------------------
         # Subtype inference
         # ------------------------------------------------
@@ -74,7 +93,7 @@ class SSLPinningStrategyInferer:
         elif "trustmanager" in blob or "checkservertrusted" in blob:
             subtype = "TrustManager Pinning"
 
-        elif any(k in blob for k in self.PINNING_SEMANTICS):
+        elif has_pinning:
             subtype = "Certificate Pinning"
 
         else:
@@ -87,19 +106,14 @@ class SSLPinningStrategyInferer:
         confidence = 0.55  # base
 
         # Enforcement strength
-        if evidence.enforcement_type == "throw":
-            confidence += 0.30
-        elif evidence.enforcement_type == "return":
-            confidence += 0.20
-        elif evidence.enforcement_type == "abort":
-            confidence += 0.15
+        confidence += self.ENFORCEMENT_BOOST.get(evidence.enforcement_type, 0.0)
 
         # Cryptographic proof boost
-        if any(k in blob for k in self.PINNING_SEMANTICS):
+        if has_pinning:
             confidence += 0.15
 
         # TrustManager / HostnameVerifier is stronger
-        if subtype in ["TrustManager Pinning", "Hostname Verification"]:
+        if subtype in self.STRONG_SUBTYPES:
             confidence += 0.10
 
         return ProtectionStrategy(
@@ -1 +1,9 @@
-from .engine import ProtectionEngine
\ No newline at end of file
+# ProtectionEngine is resolved on first access so importing a submodule
+# (e.g. engines.protection.pipeline) does not load the engine stack too
+
+
+def __getattr__(name):
+    if name == "ProtectionEngine":
+        from .engine import ProtectionEngine
+        return ProtectionEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
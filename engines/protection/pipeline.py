@@ -1,3 +1,6 @@
+import re
+
+from core.parallel import process_map
 from core.localization.pipeline_decision import DecisionLocalizationPipeline
 from core.slicing.decision.smali_root_signal_scanner import SmaliRootSignalScanner
 from core.strategy.anti_instrumentation_signal import AntiInstrumentationSignalScanner
@@ -11,14 +14,41 @@ from core.strategy.aggregator import StrategyAggregator
 from core.strategy.unified_profile import UnifiedProtectionProfiler
 
 
+def _run_scan(task):
+    scan, smali_root = task
+    return scan(smali_root)
+
+
 class ProtectionPipeline:
     """
     FINAL Protection Pipeline (ARA – M-ILEA)
     """
 
-    def __init__(self):
-        self.decision_pipeline = DecisionLocalizationPipeline()
-        self.strategy_pipeline = StrategyPipeline()
+    ANTI_INSTR_EVIDENCE_HINTS = (
+        "timing", "debugger", "frida", "ptrace", "tracerpid",
+    )
+
+    EMULATOR_EVIDENCE_HINTS = (
+        "fingerprint", "build", "qemu", "emulator", "goldfish", "test-keys",
+    )
+
+    # one alternation per hint set: a single search replaces one
+    # substring test per hint
+    _ANTI_INSTR_HINT_RE = re.compile(
+        "|".join(map(re.escape, ANTI_INSTR_EVIDENCE_HINTS))
+    )
+    _EMULATOR_HINT_RE = re.compile(
+        "|".join(map(re.escape, EMULATOR_EVIDENCE_HINTS))
+    )
+
+    def __init__(self, max_workers=None):
+        # max_workers > 1 parses smali files and runs the directory
+        # signal scans on process pools (M_ILEAOrchestrator(max_workers=...))
+        self.max_workers = max_workers
+        self.decision_pipeline = DecisionLocalizationPipeline(
+            max_workers=max_workers
+        )
+        self.strategy_pipeline = StrategyPipeline(max_workers=max_workers)
         self.aggregator = StrategyAggregator()
         self.profiler = UnifiedProtectionProfiler()
 
@@ -35,10 +65,15 @@ class ProtectionPipeline:
 
     def run(self, smali_root: str):
 
+        # --------------------------------------------------
+        # 0️⃣ Parse the smali tree ONCE (shared by 1️⃣ and 2️⃣)
+        # --------------------------------------------------
+        raw_decisions = self.decision_pipeline.collect_raw_decisions(smali_root)
+
         # --------------------------------------------------
         # 1️⃣ Decision-based flow (QUALIFIED)
         # --------------------------------------------------
-        decisions = self.decision_pipeline.run_on_smali_dir(smali_root)
+        decisions = self.decision_pipeline.qualifier.qualify(raw_decisions)
         evidences = self.decision_pipeline.extract_evidence(decisions)
 
         decision_strategies = self.strategy_pipeline.infer_from_evidence(evidences)
@@ -46,12 +81,24 @@ class ProtectionPipeline:
         # --------------------------------------------------
         # 2️⃣ Signal-based flow (ROOT) - uses RAW decisions
         # --------------------------------------------------
-        raw_decisions = self.decision_pipeline.collect_raw_decisions(smali_root)
         root_signals = []
 
+        # decisions of one file share the same _smali_lines list:
+        # match indicators once per file, not once per decision
+        indicator_index = {}
+
         for d in raw_decisions:
-            signals = self.root_signal_scanner.scan(
-                smali_lines=d._smali_lines,
+            key = id(d._smali_lines)
+            hits = indicator_index.get(key)
+            if hits is None:
+                hits = self.root_signal_scanner.match_indicators(d._smali_lines)
+                indicator_index[key] = hits
+
+            if not hits:
+                continue
+
+            signals = self.root_signal_scanner.build_signals(
+                hits,
                 class_name=d.class_name,
                 method_name=d.method_name,
             )
@@ -64,14 +111,37 @@ class ProtectionPipeline:
         # --------------------------------------------------
         # 3️⃣ Anti-Instrumentation Signal Scanner + Posture
         # --------------------------------------------------
-        anti_instr_signals = self.anti_instr_signal_scanner.scan_smali_dir(smali_root)
-        
-        # Extract anti-instrumentation decisions from evidence
-        anti_instr_decision_types = [
-            ev.decision_type for ev in evidences 
-            if any(s in str(ev.trigger_instruction).lower() + str(ev.evidence_lines).lower() for s in 
-                   ["timing", "debugger", "frida", "ptrace", "tracerpid"])
-        ]
+        # 3️⃣ 4️⃣ 5️⃣ each walk the whole tree independently
+        anti_instr_signals, emulator_signals, alvd_signals = (
+            self._scan_signal_dirs(smali_root)
+        )
+
+        # Build each evidence blob once and classify it for both
+        # anti-instrumentation (3️⃣) and emulator (4️⃣) in a single pass
+        anti_instr_decision_types = []
+        emulator_decision_count = 0
+
+        # decisions sharing a location (enforcement + abort on one if-*)
+        # slice to the same lines: classify each distinct slice once
+        hint_flags = {}
+
+        for ev in evidences:
+            key = (ev.trigger_instruction, tuple(ev.evidence_lines))
+            flags = hint_flags.get(key)
+            if flags is None:
+                blob = (
+                    str(ev.trigger_instruction) + str(ev.evidence_lines)
+                ).lower()
+                flags = self._evidence_hint_flags(blob)
+                hint_flags[key] = flags
+
+            is_anti_instr, is_emulator = flags
+
+            if is_anti_instr:
+                anti_instr_decision_types.append(ev.decision_type)
+
+            if is_emulator:
+                emulator_decision_count += 1
         
         anti_instr_posture = None
         # Analyze only if there are signals OR decision types
@@ -84,15 +154,6 @@ class ProtectionPipeline:
         # --------------------------------------------------
         # 4️⃣ Emulator Detection Signal Scanner + Posture
         # --------------------------------------------------
-        emulator_signals = self.emulator_signal_scanner.scan_smali_dir(smali_root)
-        
-        # Extract emulator-related decisions from evidence
-        emulator_decision_count = sum(
-            1 for ev in evidences 
-            if any(s in str(ev.trigger_instruction).lower() + str(ev.evidence_lines).lower() for s in 
-                   ["fingerprint", "build", "qemu", "emulator", "goldfish", "test-keys"])
-        )
-        
         emulator_posture = None
         # Analyze only if there are signals OR decision count
         if emulator_signals or emulator_decision_count > 0:
@@ -105,8 +166,6 @@ class ProtectionPipeline:
         # --------------------------------------------------
         # 5️⃣ ALVD (App-Level Virtualization Detection)
         # --------------------------------------------------
-        alvd_signals = self.alvd_signal_scanner.scan(smali_root)
-        
         alvd_posture = None
         if alvd_signals:
             alvd_posture = self.alvd_posture_analyzer.analyze(alvd_signals)
@@ -114,7 +173,9 @@ class ProtectionPipeline:
         # --------------------------------------------------
         # 6️⃣ Aggregate + Profile
         # --------------------------------------------------
-        all_strategies = decision_strategies + signal_strategies
+        # extend in place instead of copying both lists into a new one
+        all_strategies = decision_strategies
+        all_strategies.extend(signal_strategies)
 
         aggregated = self.aggregator.aggregate(all_strategies)
 
@@ -137,3 +198,32 @@ class ProtectionPipeline:
             "emulator_signals": len(emulator_signals),
             "alvd_signals": len(alvd_signals),
         }
+
+    # --------------------------------------------------
+    # Evidence hint classification
+    # --------------------------------------------------
+    def _evidence_hint_flags(self, blob: str):
+        """(is_anti_instr, is_emulator) for a lowered evidence blob."""
+        return (
+            self._ANTI_INSTR_HINT_RE.search(blob) is not None,
+            self._EMULATOR_HINT_RE.search(blob) is not None,
+        )
+
+    # --------------------------------------------------
+    # Directory signal scans
+    # --------------------------------------------------
+    def _scan_signal_dirs(self, smali_root: str):
+        scans = (
+            self.anti_instr_signal_scanner.scan_smali_dir,
+            self.emulator_signal_scanner.scan_smali_dir,
+            self.alvd_signal_scanner.scan,
+        )
+
+        if self.max_workers and self.max_workers > 1:
+            return tuple(process_map(
+                _run_scan,
+                [(scan, smali_root) for scan in scans],
+                self.max_workers,
+            ))
+
+        return tuple(scan(smali_root) for scan in scans)
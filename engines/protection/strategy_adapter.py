@@ -4,21 +4,27 @@ class StrategyAdapter:
     into .analyze(workspace)
     """
 
+    # Most common patterns, in order of preference
+    ENTRY_POINTS = ("analyze", "infer", "run")
+
     def __init__(self, strategy):
         self.strategy = strategy
 
-    def analyze(self, workspace: str):
-        # Most common patterns
-        if hasattr(self.strategy, "analyze"):
-            return self.strategy.analyze(workspace)
-
-        if hasattr(self.strategy, "infer"):
-            return self.strategy.infer(workspace)
+        # resolved once: every analyze() is then a plain call
+        self._entry = next(
+            (
+                getattr(strategy, name)
+                for name in self.ENTRY_POINTS
+                if hasattr(strategy, name)
+            ),
+            None,
+        )
 
-        if hasattr(self.strategy, "run"):
-            return self.strategy.run(workspace)
+    def analyze(self, workspace: str):
+        if self._entry is None:
+            raise AttributeError(
+                f"{self.strategy.__class__.__name__} "
+                "has no analyze / infer / run method"
+            )
 
-        raise AttributeError(
-            f"{self.strategy.__class__.__name__} "
-            "has no analyze / infer / run method"
-        )
+        return self._entry(workspace)
@@ -1,6 +1,8 @@
 # engines/protection/strategy_pipeline.py
 
-from typing import List
+from typing import List, Optional
+
+from core.parallel import process_map
 
 # === MODELS ===
 from core.decision.models import DecisionEvidenceSlice
@@ -17,6 +19,19 @@ from core.strategy.emulator_inferer import EmulatorDetectionStrategyInferer
 from core.strategy.alvd_posture import ALVDPostureAnalyzer
 
 
+# -------------------------
+# Per-chunk worker (process pool)
+# -------------------------
+_worker_pipeline: Optional["StrategyPipeline"] = None
+
+
+def _infer_chunk(evidences: List[DecisionEvidenceSlice]) -> List[ProtectionStrategy]:
+    global _worker_pipeline
+    if _worker_pipeline is None:
+        _worker_pipeline = StrategyPipeline()
+    return _worker_pipeline._infer_sequential(evidences)
+
+
 class StrategyPipeline:
     """
     Strategy Pipeline (FINAL – M-ILEA)
@@ -29,7 +44,13 @@ class StrategyPipeline:
     - List[ProtectionStrategy]
     """
 
-    def __init__(self):
+    # below this many slices a process pool costs more than it saves
+    PARALLEL_MIN_EVIDENCES = 1000
+
+    def __init__(self, max_workers: Optional[int] = None):
+        # > 1 fans large evidence batches out to a process pool
+        self.max_workers = max_workers
+
         # Decision-based inferers
         self.ssl_inferer = SSLPinningStrategyInferer()
         self.anti_tampering_inferer = AntiTamperingStrategyInferer()
@@ -50,21 +71,48 @@ class StrategyPipeline:
         evidences: List[DecisionEvidenceSlice],
     ) -> List[ProtectionStrategy]:
 
+        # every slice is inferred independently: contiguous chunks keep
+        # the merged strategies in evidence order
+        if (
+            self.max_workers
+            and self.max_workers > 1
+            and len(evidences) >= self.PARALLEL_MIN_EVIDENCES
+        ):
+            size = -(-len(evidences) // self.max_workers)
+            chunks = [
+                evidences[i:i + size] for i in range(0, len(evidences), size)
+            ]
+
+            strategies: List[ProtectionStrategy] = []
+            for part in process_map(_infer_chunk, chunks, self.max_workers):
+                strategies.extend(part)
+            return strategies
+
+        return self._infer_sequential(evidences)
+
+    def _infer_sequential(
+        self,
+        evidences: List[DecisionEvidenceSlice],
+    ) -> List[ProtectionStrategy]:
+
         strategies: List[ProtectionStrategy] = []
 
         for ev in evidences:
+            # shared lowered text for the keyword-based inferers
+            blob = ev.search_blob()
+
             # ---------------- SSL PINNING ----------------
-            s = self.ssl_inferer.infer(ev)
+            s = self.ssl_inferer.infer(ev, blob=blob)
             if s:
                 strategies.append(s)
 
             # ---------------- ANTI-TAMPERING -------------
-            s = self.anti_tampering_inferer.infer(ev)
+            s = self.anti_tampering_inferer.infer(ev, blob=blob)
             if s:
                 strategies.append(s)
 
             # ---------------- ANTI-INSTRUMENTATION -------
-            s = self.anti_instr_inferer.infer(ev)
+            s = self.anti_instr_inferer.infer(ev, blob=blob)
             if s:
                 strategies.append(s)
 
@@ -78,14 +126,8 @@ class StrategyPipeline:
         signals: List[RootSignal],
     ) -> List[ProtectionStrategy]:
 
-        strategies: List[ProtectionStrategy] = []
-
-        for sig in signals:
-            s = self.root_inferer.infer_from_signal(sig)
-            if s:
-                strategies.append(s)
-
-        return strategies
+        # one batched call instead of a dispatch per signal
+        return self.root_inferer.infer(signals)
 
     # ==========================================================
     # EMULATOR / ALVD (OPTIONAL SIGNAL-BASED)
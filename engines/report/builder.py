@@ -1,6 +1,8 @@
 # engines/report/builder.py
 from typing import List, Dict, Any
 
+from .serialize import to_report_dict
+
 
 class UnifiedReportBuilder:
     """
@@ -33,13 +35,7 @@ class UnifiedReportBuilder:
         return {
             "metadata": metadata,
             "ara": ara,
-            "vulnerabilities": [
-                v.as_dict() if hasattr(v, "as_dict") else v
-                for v in vulnerabilities
-            ],
-            "correlated_findings": [
-                cf.as_dict() if hasattr(cf, "as_dict") else cf
-                for cf in correlated_findings
-            ],
+            "vulnerabilities": list(map(to_report_dict, vulnerabilities)),
+            "correlated_findings": list(map(to_report_dict, correlated_findings)),
             "risk_score": risk_score,
         }
@@ -1,6 +1,6 @@
 # engines/report/html_generator.py
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 
 
 class UnifiedHTMLReportGenerator:
@@ -12,11 +12,24 @@ class UnifiedHTMLReportGenerator:
     Must read object attributes properly
     """
 
+    # mitigation status -> badge CSS class (anything else: badge-not)
+    STATUS_BADGES = {
+        "MITIGATED": "badge-mitigated",
+        "PARTIALLY_MITIGATED": "badge-partial",
+    }
+
     def __init__(self):
         pass
 
     def generate(self, report: Dict[str, Any]) -> str:
         """Generate HTML from report dict"""
+        return "".join(self.iter_html(report))
+
+    def iter_html(self, report: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the document in chunks (head, one block per finding, tail),
+        so callers can stream it to a file without building one string
+        """
         now = datetime.utcnow().isoformat()
 
         metadata = report.get("metadata", {})
@@ -24,11 +37,10 @@ class UnifiedHTMLReportGenerator:
         correlated_findings = report.get("correlated_findings", [])
         risk_score = report.get("risk_score", {})
 
-        vulns_html = self._render_findings(correlated_findings)
         ara_html = self._render_ara(ara)
         explanation_html = self._render_explanation(risk_score.get("explanation", []))
 
-        return f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -191,7 +203,11 @@ class UnifiedHTMLReportGenerator:
 
 <div class="card">
     <h2>⚠️ Vulnerability Findings</h2>
-    {vulns_html}
+    """
+
+        yield from self._iter_findings(correlated_findings)
+
+        yield """
 </div>
 
 <footer>
@@ -203,12 +219,12 @@ class UnifiedHTMLReportGenerator:
 </body>
 </html>"""
 
-    def _render_findings(self, findings: List[Dict[str, Any]]) -> str:
-        """Render correlated findings"""
+    def _iter_findings(self, findings: List[Dict[str, Any]]) -> Iterator[str]:
+        """Render correlated findings, one block at a time"""
         if not findings:
-            return "<p><em>✓ No vulnerabilities detected.</em></p>"
+            yield "<p><em>✓ No vulnerabilities detected.</em></p>"
+            return
 
-        html_blocks = []
         for f in findings:
             owasp = f.get("owasp_id", "UNKNOWN")
             title = f.get("title", "Unknown")
@@ -217,13 +233,13 @@ class UnifiedHTMLReportGenerator:
             status = f.get("mitigation_status", "NOT_MITIGATED")
             reasoning = f.get("reasoning", [])
 
-            status_badge = "badge-mitigated" if status == "MITIGATED" else                           "badge-partial" if status == "PARTIALLY_MITIGATED" else                           "badge-not"
+            status_badge = self.STATUS_BADGES.get(status, "badge-not")
 
             reasoning_html = "".join(
                 f'<div class="reasoning-item">• {r}</div>' for r in reasoning
             ) if reasoning else '<div class="reasoning-item">No mitigation information</div>'
 
-            html_blocks.append(f"""
+            yield f"""
 <div class="finding">
     <div class="finding-title">{owasp}: {title}</div>
     <div>
@@ -236,9 +252,7 @@ class UnifiedHTMLReportGenerator:
         {reasoning_html}
     </div>
 </div>
-""")
-
-        return "".join(html_blocks)
+"""
 
     def _render_ara(self, ara: Dict[str, Any]) -> str:
         """Render ARA protection profile"""
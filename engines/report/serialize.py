@@ -0,0 +1,14 @@
+# engines/report/serialize.py
+from typing import Any
+
+
+def to_report_dict(item: Any) -> Any:
+    """
+    Report form of one finding: plain dicts (the orchestrator's shared
+    finding dicts) pass through on an exact type check, objects are
+    converted with their own as_dict(), anything else is kept as-is.
+    """
+    if type(item) is dict:
+        return item
+    as_dict = getattr(item, "as_dict", None)
+    return item if as_dict is None else as_dict()
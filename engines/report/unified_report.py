@@ -4,6 +4,17 @@ from typing import List, Dict, Any
 
 from .models import ReportSummary, RiskScore
 
+# severity → base weight for the report risk score (unknown: 0)
+SEVERITY_BASE = {
+    "LOW": 1,
+    "MEDIUM": 3,
+    "HIGH": 7,
+    "CRITICAL": 10,
+}
+
+# severities exploitable when anti-tampering is missing
+EXPLOITABLE_SEVERITIES = frozenset(("HIGH", "CRITICAL"))
+
 
 @dataclass
 class UnifiedSecurityReport:
@@ -27,9 +38,12 @@ class UnifiedSecurityReport:
         by_sev = {}
         by_owasp = {}
 
+        # each key read once per finding and bound locally
         for v in self.vulnerabilities:
-            by_sev[v["severity"]] = by_sev.get(v["severity"], 0) + 1
-            by_owasp[v["owasp_id"]] = by_owasp.get(v["owasp_id"], 0) + 1
+            sev = v["severity"]
+            owasp_id = v["owasp_id"]
+            by_sev[sev] = by_sev.get(sev, 0) + 1
+            by_owasp[owasp_id] = by_owasp.get(owasp_id, 0) + 1
 
         self.summary = ReportSummary(
             total_findings=len(self.vulnerabilities),
@@ -44,11 +58,17 @@ class UnifiedSecurityReport:
         anti_tampering = self.ara.get("ANTI_TAMPERING", {}).get("present", False)
         anti_instr = self.ara.get("ANTI_INSTRUMENTATION", {}).get("posture", "NONE")
 
+        # the posture checks do not depend on the finding: decide them once
+        missing_anti_tampering = not anti_tampering
+        strong_anti_instr = anti_instr == "HIGH"
+
         for v in self.vulnerabilities:
-            if v["severity"] in ["HIGH", "CRITICAL"] and not anti_tampering:
+            sev = v["severity"]
+
+            if missing_anti_tampering and sev in EXPLOITABLE_SEVERITIES:
                 exploitable.append(v)
 
-            if v["severity"] == "MEDIUM" and anti_instr == "HIGH":
+            if strong_anti_instr and sev == "MEDIUM":
                 protected.append(v)
 
         self.correlation = {
@@ -60,12 +80,7 @@ class UnifiedSecurityReport:
         score = 0
 
         for v in self.vulnerabilities:
-            base = {
-                "LOW": 1,
-                "MEDIUM": 3,
-                "HIGH": 7,
-                "CRITICAL": 10,
-            }.get(v["severity"], 0)
+            base = SEVERITY_BASE.get(v["severity"], 0)
 
             score += base * v.get("confidence", 0.5)
 
@@ -18,9 +18,21 @@ class CorrelationEngine:
     Must NOT calculate risk score
     """
 
+    # Severity ladder, lowest first; the index dict dispatches on the
+    # severity string instead of scanning the ladder per finding
+    SEVERITY_ORDER = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+    SEVERITY_INDEX = {sev: idx for idx, sev in enumerate(SEVERITY_ORDER)}
+
     def __init__(self):
         self.rules = CORRELATION_RULES
 
+        # owasp_id -> depends_on, flattened once so each finding costs
+        # a single lookup
+        self._depends_on = {
+            owasp_id: rule.get("depends_on", [])
+            for owasp_id, rule in self.rules.items()
+        }
+
     def correlate(
         self,
         vulnerabilities: List,
@@ -38,30 +50,28 @@ class CorrelationEngine:
         else:
             profile_dict = protection_profile if isinstance(protection_profile, dict) else {}
 
+        # protection -> (is_present, reasoning line); every finding with
+        # the same dependency reuses the resolved posture and its text
+        protection_states = {}
+
         for vuln in vulnerabilities:
-            # Get correlation rule for this OWASP ID
-            rule = self.rules.get(vuln.owasp_id, {})
-            protection_deps = rule.get("depends_on", [])
+            # Protections the correlation rule for this OWASP ID depends on
+            protection_deps = self._depends_on.get(vuln.owasp_id, [])
 
             reasoning = []
             mitigated_count = 0
 
             # Check which protections are present
             for protection in protection_deps:
-                posture = profile_dict.get(protection, {})
-
-                if isinstance(posture, dict):
-                    is_present = posture.get("present", False)
-                    difficulty = posture.get("difficulty", "UNKNOWN")
-                else:
-                    is_present = bool(posture)
-                    difficulty = "UNKNOWN"
+                state = protection_states.get(protection)
+                if state is None:
+                    state = self._protection_state(profile_dict, protection)
+                    protection_states[protection] = state
 
+                is_present, reason = state
                 if is_present:
                     mitigated_count += 1
-                    reasoning.append(f"{protection} present (bypass: {difficulty})")
-                else:
-                    reasoning.append(f"{protection} missing")
+                reasoning.append(reason)
 
             # Evaluate mitigation status and effective risk
             mitigation_status, effective_risk = self._evaluate(
@@ -85,6 +95,24 @@ class CorrelationEngine:
 
         return correlated
 
+    def _protection_state(self, profile_dict: Dict, protection: str) -> tuple:
+        """
+        Resolve one protection's presence and its reasoning line
+        Returns (is_present, reason)
+        """
+        posture = profile_dict.get(protection, {})
+
+        if isinstance(posture, dict):
+            is_present = posture.get("present", False)
+            difficulty = posture.get("difficulty", "UNKNOWN")
+        else:
+            is_present = bool(posture)
+            difficulty = "UNKNOWN"
+
+        if is_present:
+            return is_present, f"{protection} present (bypass: {difficulty})"
+        return is_present, f"{protection} missing"
+
     def _evaluate(
         self,
         base_severity: str,
@@ -114,10 +142,7 @@ class CorrelationEngine:
 
     def _downgrade(self, severity: str, steps: int) -> str:
         """Downgrade severity by N steps"""
-        order = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
-        try:
-            idx = order.index(severity)
-            new_idx = max(0, idx - steps)
-            return order[new_idx]
-        except ValueError:
+        idx = self.SEVERITY_INDEX.get(severity)
+        if idx is None:
             return severity
+        return self.SEVERITY_ORDER[max(0, idx - steps)]
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelatedFinding:
     """
     Correlated Finding Object - NOT a dict
@@ -1,5 +1,6 @@
 # engines/vulnerability/credentials/hardcoded_credential_scanner.py
 
+import mmap
 import os
 import re
 from typing import List
@@ -40,6 +41,28 @@ class HardcodedCredentialScanner:
 
     STRING_INSTRUCTION = "const-string"
 
+    # compiled once per class: one alternation per subtype
+    _COMPILED_PATTERNS = {
+        subtype: re.compile("|".join(patterns))
+        for subtype, patterns in CREDENTIAL_PATTERNS.items()
+    }
+
+    # union of every subtype: most const-string lines match nothing,
+    # so they are rejected with one search instead of one per subtype
+    _ANY_CREDENTIAL_RE = re.compile(
+        "|".join(p for patterns in CREDENTIAL_PATTERNS.values() for p in patterns)
+    )
+
+    # byte-level fast path: files without any const-string are never decoded
+    _STRING_INSTRUCTION_BYTES_RE = re.compile(
+        re.escape(STRING_INSTRUCTION.encode()), re.IGNORECASE
+    )
+
+    _STRING_LINE_RE = re.compile(
+        r"^.*" + re.escape(STRING_INSTRUCTION) + r".*$",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
     def scan(self, smali_root: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
@@ -52,34 +75,66 @@ class HardcodedCredentialScanner:
                 rel_path = path.replace(smali_root, "").lstrip("/")
 
                 try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
+                    text = self._read_if_has_strings(path)
                 except Exception:
                     continue
 
-                for idx, line in enumerate(lines):
-                    l = line.lower()
+                if text is None:
+                    continue
 
-                    # only focus on literal strings
-                    if self.STRING_INSTRUCTION not in l:
+                if "\r" in text:
+                    # keep text-mode newline semantics
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+                # only focus on literal strings: jump straight to const-string
+                # lines instead of walking every line of the file
+                line_no = 1
+                last_pos = 0
+                for m in self._STRING_LINE_RE.finditer(text):
+                    line_no += text.count("\n", last_pos, m.start())
+                    last_pos = m.start()
+
+                    line = m.group(0)
+                    l = line.lower()
+                    if not self._ANY_CREDENTIAL_RE.search(l):
                         continue
 
-                    for subtype, patterns in self.CREDENTIAL_PATTERNS.items():
-                        for p in patterns:
-                            if re.search(p, l):
-                                signals.append(
-                                    VulnerabilitySignal(
-                                        owasp_id="M1",
-                                        category="IMPROPER_CREDENTIAL_USAGE",
-                                        subtype=subtype,
-                                        source="smali",
-                                        file=rel_path,
-                                        line=idx + 1,
-                                        code=line.strip(),
-                                        evidence=[line.strip()],
-                                        confidence=0.65,
-                                    )
+                    code = line.strip()
+
+                    for subtype, pattern in self._COMPILED_PATTERNS.items():
+                        if pattern.search(l):
+                            signals.append(
+                                VulnerabilitySignal(
+                                    owasp_id="M1",
+                                    category="IMPROPER_CREDENTIAL_USAGE",
+                                    subtype=subtype,
+                                    source="smali",
+                                    file=rel_path,
+                                    line=line_no,
+                                    code=code,
+                                    evidence=[code],
+                                    confidence=0.65,
                                 )
-                                break
+                            )
 
         return signals
+
+    # ------------------------
+    # Utils
+    # ------------------------
+
+    def _read_if_has_strings(self, path: str):
+        """
+        Return the decoded file text, or None when it holds no
+        const-string. The gate runs on a read-only mapping and the text
+        is decoded straight from it, so no intermediate bytes copy of
+        the file is ever allocated.
+        """
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return None
+
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not self._STRING_INSTRUCTION_BYTES_RE.search(mm):
+                    return None
+                return str(mm, "utf-8", "ignore")
@@ -1,8 +1,12 @@
 # engines/vulnerability/crypto/weak_crypto_scanner.py
 
-import os
+import re
 from typing import List
 from engines.vulnerability.models import VulnerabilitySignal
+from engines.vulnerability.smali_reader import (
+    list_smali_files,
+    read_smali_lines,
+)
 
 
 class WeakCryptographyScanner:
@@ -18,40 +22,50 @@ class WeakCryptographyScanner:
         "deprecated_crypto": ["cipher.getinstance"],
     }
 
+    # one alternation per subtype, plus a union gate over every keyword
+    _WEAK_RES = {
+        subtype: re.compile("|".join(re.escape(k) for k in keywords))
+        for subtype, keywords in WEAK_PATTERNS.items()
+    }
+    _ANY_WEAK_RE = re.compile(
+        "|".join(
+            re.escape(k) for keywords in WEAK_PATTERNS.values() for k in keywords
+        )
+    )
+
     def scan(self, smali_root: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        for root, _, files in os.walk(smali_root):
-            for f in files:
-                if not f.endswith(".smali"):
-                    continue
+        for path in list_smali_files(smali_root):
+            rel_path = path.replace(smali_root, "").lstrip("/")
 
-                path = os.path.join(root, f)
-                rel_path = path.replace(smali_root, "").lstrip("/")
+            try:
+                lines = read_smali_lines(path)
+            except Exception:
+                continue
 
-                try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
-                except Exception:
+            for idx, line in enumerate(lines):
+                l = line.lower()
+                if not self._ANY_WEAK_RE.search(l):
                     continue
 
-                for idx, line in enumerate(lines):
-                    l = line.lower()
-
-                    for subtype, keywords in self.WEAK_PATTERNS.items():
-                        if any(k in l for k in keywords):
-                            signals.append(
-                                VulnerabilitySignal(
-                                    owasp_id="M10",
-                                    category="INSUFFICIENT_CRYPTOGRAPHY",
-                                    subtype=subtype,
-                                    source="smali",
-                                    file=rel_path,
-                                    line=idx + 1,
-                                    code=line.strip(),
-                                    evidence=[line.strip()],
-                                    confidence=0.6,
-                                )
+                # stripped once, shared by every signal raised on this line
+                code = line.strip()
+
+                for subtype, pattern in self._WEAK_RES.items():
+                    if pattern.search(l):
+                        signals.append(
+                            VulnerabilitySignal(
+                                owasp_id="M10",
+                                category="INSUFFICIENT_CRYPTOGRAPHY",
+                                subtype=subtype,
+                                source="smali",
+                                file=rel_path,
+                                line=idx + 1,
+                                code=code,
+                                evidence=[code],
+                                confidence=0.6,
                             )
+                        )
 
         return signals
@@ -18,15 +18,20 @@ class M4InputValidationInferer(BaseVulnerabilityInferer):
     def infer(self, signals):
         findings = []
 
-        grouped = {}
+        # built once: a set probe per signal instead of a fresh list scan
+        supported = set(self.supported_subtypes())
+
+        # only the size of each (subtype, file) group is ever used, so
+        # count per key instead of collecting every signal into lists
+        counts = {}
         for s in signals:
-            if s.subtype not in self.supported_subtypes():
+            if s.subtype not in supported:
                 continue
             key = (s.subtype, s.file)
-            grouped.setdefault(key, []).append(s)
+            counts[key] = counts.get(key, 0) + 1
 
-        for (subtype, file), group in grouped.items():
-            if len(group) < 10:
+        for (subtype, file), count in counts.items():
+            if count < 10:
                 continue
 
             findings.append(
@@ -36,11 +41,11 @@ class M4InputValidationInferer(BaseVulnerabilityInferer):
                     category="INSUFFICIENT_INPUT_VALIDATION",
                     subtype=subtype,
                     severity="MEDIUM",
-                    confidence=min(0.95, 0.4 + len(group) * 0.01),
+                    confidence=min(0.95, 0.4 + count * 0.01),
                     description="Input is used without sufficient validation.",
                     recommendation="Validate and sanitize all external inputs.",
                     remediation="Apply strict input validation and allowlists.",
-                    evidence=[f"{subtype} detected {len(group)} times"],
+                    evidence=[f"{subtype} detected {count} times"],
                     affected_files=[file],
                 )
             )
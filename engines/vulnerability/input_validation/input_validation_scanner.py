@@ -1,8 +1,12 @@
 # engines/vulnerability/input_validation/input_validation_scanner.py
 
-import os
+import re
 from typing import List
 from engines.vulnerability.models import VulnerabilitySignal
+from engines.vulnerability.smali_reader import (
+    list_smali_files,
+    read_smali_lines,
+)
 
 
 class InputValidationScanner:
@@ -33,40 +37,49 @@ class InputValidationScanner:
         ],
     }
 
+    # one alternation per subtype, plus a union gate over every keyword
+    _SIGNAL_RES = {
+        subtype: re.compile("|".join(re.escape(k) for k in keywords))
+        for subtype, keywords in SIGNALS.items()
+    }
+    _ANY_SIGNAL_RE = re.compile(
+        "|".join(
+            re.escape(k) for keywords in SIGNALS.values() for k in keywords
+        )
+    )
+
     def scan(self, smali_root: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        for root, _, files in os.walk(smali_root):
-            for f in files:
-                if not f.endswith(".smali"):
-                    continue
+        for path in list_smali_files(smali_root):
+            rel_path = path.replace(smali_root, "").lstrip("/")
 
-                path = os.path.join(root, f)
-                rel_path = path.replace(smali_root, "").lstrip("/")
+            try:
+                lines = read_smali_lines(path)
+            except Exception:
+                continue
 
-                try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
-                except Exception:
+            for idx, line in enumerate(lines):
+                l = line.lower()
+                if not self._ANY_SIGNAL_RE.search(l):
                     continue
 
-                for idx, line in enumerate(lines):
-                    l = line.lower()
+                code = line.strip()
 
-                    for subtype, keywords in self.SIGNALS.items():
-                        if any(k in l for k in keywords):
-                            signals.append(
-                                VulnerabilitySignal(
-                                    owasp_id="M4",
-                                    category="INSUFFICIENT_INPUT_VALIDATION",
-                                    subtype=subtype,
-                                    source="smali",
-                                    file=rel_path,
-                                    line=idx + 1,
-                                    code=line.strip(),
-                                    evidence=[line.strip()],
-                                    confidence=0.6,
-                                )
+                for subtype, pattern in self._SIGNAL_RES.items():
+                    if pattern.search(l):
+                        signals.append(
+                            VulnerabilitySignal(
+                                owasp_id="M4",
+                                category="INSUFFICIENT_INPUT_VALIDATION",
+                                subtype=subtype,
+                                source="smali",
+                                file=rel_path,
+                                line=idx + 1,
+                                code=code,
+                                evidence=[code],
+                                confidence=0.6,
                             )
+                        )
 
         return signals
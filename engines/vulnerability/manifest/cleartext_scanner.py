@@ -1,8 +1,8 @@
 # engines/vulnerability/manifest/cleartext_scanner.py
 
-import xml.etree.ElementTree as ET
 from typing import List
 from engines.vulnerability.models import VulnerabilitySignal
+from engines.vulnerability.manifest.reader import parse_manifest
 
 ANDROID_NS = "{http://schemas.android.com/apk/res/android}"
 
@@ -16,8 +16,7 @@ class CleartextTrafficScanner:
     def scan(self, manifest_path: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        tree = ET.parse(manifest_path)
-        root = tree.getroot()
+        root = parse_manifest(manifest_path)
 
         app = root.find("application")
         if app is None:
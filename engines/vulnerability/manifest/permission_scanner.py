@@ -1,8 +1,8 @@
 # engines/vulnerability/manifest/permission_scanner.py
 
-import xml.etree.ElementTree as ET
 from typing import List
 from engines.vulnerability.models import VulnerabilitySignal
+from engines.vulnerability.manifest.reader import parse_manifest
 
 ANDROID_NS = "{http://schemas.android.com/apk/res/android}"
 
@@ -26,8 +26,7 @@ class DangerousPermissionScanner:
     def scan(self, manifest_path: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        tree = ET.parse(manifest_path)
-        root = tree.getroot()
+        root = parse_manifest(manifest_path)
 
         for perm in root.findall("uses-permission"):
             name = perm.get(ANDROID_NS + "name")
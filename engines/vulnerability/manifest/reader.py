@@ -0,0 +1,24 @@
+# engines/vulnerability/manifest/reader.py
+import os
+import xml.etree.ElementTree as ET
+
+from engines.vulnerability.smali_reader import scan_cache
+
+
+def parse_manifest(manifest_path: str) -> ET.Element:
+    """
+    Root element of AndroidManifest.xml. Inside shared_scan() it is
+    parsed once and shared by the manifest scanners of that scan, keyed
+    on mtime/size so an edited file is parsed again; outside a scan it
+    is parsed on every call. Errors propagate like ET.parse().
+    """
+    cache = scan_cache("manifest")
+    if cache is None:
+        return ET.parse(manifest_path).getroot()
+
+    st = os.stat(manifest_path)
+    key = (manifest_path, st.st_mtime_ns, st.st_size)
+    root = cache.get(key)
+    if root is None:
+        root = cache[key] = ET.parse(manifest_path).getroot()
+    return root
@@ -1,9 +1,9 @@
 # engines/vulnerability/manifest/scanner.py
 
-import xml.etree.ElementTree as ET
 from typing import List
 
 from engines.vulnerability.models import VulnerabilitySignal
+from engines.vulnerability.manifest.reader import parse_manifest
 from engines.vulnerability.manifest.rules import MANIFEST_RULES
 
 
@@ -19,8 +19,7 @@ class AndroidManifestScanner:
     def scan(self, manifest_path: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        tree = ET.parse(manifest_path)
-        root = tree.getroot()
+        root = parse_manifest(manifest_path)
 
         app = root.find("application")
         if app is None:
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class VulnerabilitySignal:
     """Low-level vulnerability indicator (NO enforcement logic)."""
     owasp_id: str
@@ -19,9 +19,11 @@ class M_ILEAOrchestrator:
     Enforces strict separation of concerns.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.vuln_engine = VulnerabilityEngine()
-        self.protection_pipeline = ProtectionPipeline()
+        # max_workers > 1 runs the protection stage's smali parsing and
+        # signal scans on a process pool; None keeps it sequential
+        self.protection_pipeline = ProtectionPipeline(max_workers=max_workers)
         self.correlation_engine = CorrelationEngine()
         self.risk_engine = RiskScoringEngine()
         self.report_builder = UnifiedReportBuilder()
@@ -43,6 +45,23 @@ class M_ILEAOrchestrator:
 
         Returns: {report: dict, html: str}
         """
+        report = self._build_report(workspace_path, metadata)
+
+        print("[6/6] Generating HTML Report...")
+        html = self.html_generator.generate(report)
+        print("  → HTML generated")
+
+        return {
+            "report": report,
+            "html": html,
+        }
+
+    def _build_report(
+        self,
+        workspace_path: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Stages 1-5: everything up to the assembled report dict"""
         if metadata is None:
             metadata = {"workspace": workspace_path, "version": "1.0"}
 
@@ -68,23 +87,27 @@ class M_ILEAOrchestrator:
         print(f"  → Risk Level: {risk_score['level']} (score: {risk_score['numeric']})")
 
         print("[5/6] Building Unified Report...")
+        # correlate() emits one CorrelatedFinding per vulnerability, in order,
+        # each holding vuln.as_dict(): share those dicts instead of
+        # serializing every finding a second time for the report. The
+        # report's vulnerabilities and original_finding entries are then
+        # the same dict objects.
+        if len(correlated_findings) != len(vulnerabilities):
+            raise RuntimeError(
+                f"correlation returned {len(correlated_findings)} findings "
+                f"for {len(vulnerabilities)} vulnerabilities"
+            )
+
         report = self.report_builder.build(
             metadata=metadata,
             ara=ara_dict,
-            vulnerabilities=vulnerabilities,
+            vulnerabilities=[cf.original_finding for cf in correlated_findings],
             correlated_findings=correlated_findings,
             risk_score=risk_score,
         )
         print("  → Report assembled")
 
-        print("[6/6] Generating HTML Report...")
-        html = self.html_generator.generate(report)
-        print("  → HTML generated")
-
-        return {
-            "report": report,
-            "html": html,
-        }
+        return report
 
     def analyze_to_file(
         self,
@@ -95,8 +118,12 @@ class M_ILEAOrchestrator:
         """
         Full pipeline with HTML file output
         """
-        result = self.analyze(workspace_path, metadata)
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(result["html"])
+        report = self._build_report(workspace_path, metadata)
+
+        print("[6/6] Generating HTML Report...")
+        # streamed chunk by chunk: the document never exists as one string
+        with open(output_file, "w", encoding="utf-8") as fh:
+            fh.writelines(self.html_generator.iter_html(report))
+        print("  → HTML generated")
         print(f"\n✓ Report saved to {output_file}")
         return output_file
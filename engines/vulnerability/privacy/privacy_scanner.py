@@ -1,8 +1,11 @@
 # engines/vulnerability/privacy/privacy_scanner.py
 
 import os
+import re
+import sys
 from typing import List
 from engines.vulnerability.models import VulnerabilitySignal
+from engines.vulnerability.smali_reader import read_smali_lines
 
 
 class PrivacyScanner:
@@ -44,10 +47,41 @@ class PrivacyScanner:
         "setrequestproperty",
     ]
 
+    # a signal needs a PII source AND a network sink on one line, so a
+    # file lacking either is ruled out before any per-line work
+    _ANY_SOURCE_RE = re.compile(
+        "|".join(
+            re.escape(src) for sources in PII_SOURCES.values() for src in sources
+        )
+    )
+    _NETWORK_SINK_RE = re.compile("|".join(re.escape(n) for n in NETWORK_SINKS))
+
+    # (sources alternation, subtype) per PII type; the subtype is formatted
+    # and interned once, so every signal of a type shares one string object
+    _PII_RULES = tuple(
+        (
+            re.compile("|".join(re.escape(src) for src in sources)),
+            sys.intern(f"{pii_type}_sent_over_network"),
+        )
+        for pii_type, sources in PII_SOURCES.items()
+    )
+
     def scan(self, smali_root: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        for root, _, files in os.walk(smali_root):
+        sink_search = self._NETWORK_SINK_RE.search
+        pii_rules = self._PII_RULES
+
+        for root, dirs, files in os.walk(smali_root):
+            # 🔥 FILTER FRAMEWORK (once per directory: prune whole subtree)
+            rel_root = root.replace(smali_root, "").lstrip("/")
+            dirs[:] = [
+                d for d in dirs
+                if not (
+                    f"{rel_root}/{d}/" if rel_root else f"{d}/"
+                ).startswith(self.FRAMEWORK_PREFIXES)
+            ]
+
             for f in files:
                 if not f.endswith(".smali"):
                     continue
@@ -55,33 +89,38 @@ class PrivacyScanner:
                 path = os.path.join(root, f)
                 rel_path = path.replace(smali_root, "").lstrip("/")
 
-                # 🔥 FILTER FRAMEWORK
                 if rel_path.startswith(self.FRAMEWORK_PREFIXES):
                     continue
 
                 try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-                        lines = fh.readlines()
+                    lines = read_smali_lines(path)
                 except Exception:
                     continue
 
-                for idx, line in enumerate(lines):
-                    l = line.lower()
+                text = "".join(lines).lower()
+                if not (sink_search(text) and self._ANY_SOURCE_RE.search(text)):
+                    continue
+
+                # every read line ends in exactly one "\n", so the lowered
+                # file splits back into the same lines: no line is lowered twice
+                for idx, (line, l) in enumerate(zip(lines, text.split("\n"))):
+                    if not sink_search(l):
+                        continue
+
+                    code = line.strip()
 
-                    for pii_type, sources in self.PII_SOURCES.items():
-                        if any(src in l for src in sources) and any(
-                            net in l for net in self.NETWORK_SINKS
-                        ):
+                    for source_re, subtype in pii_rules:
+                        if source_re.search(l):
                             signals.append(
                                 VulnerabilitySignal(
                                     owasp_id="M6",
                                     category="INADEQUATE_PRIVACY_CONTROLS",
-                                    subtype=f"{pii_type}_sent_over_network",
+                                    subtype=subtype,
                                     source="smali",
                                     file=rel_path,
                                     line=idx + 1,
-                                    code=line.strip(),
-                                    evidence=[line.strip()],
+                                    code=code,
+                                    evidence=[code],
                                     confidence=0.85,
                                 )
                             )
@@ -1,3 +1,6 @@
+from engines.report.serialize import to_report_dict
+
+
 class UnifiedReportBuilder:
     """
     FINAL Unified Report Builder (A2)
@@ -17,10 +20,7 @@ class UnifiedReportBuilder:
         return {
             "metadata": metadata,
             "ara": ara,
-            "vulnerabilities": [
-                v.as_dict() if hasattr(v, "as_dict") else v
-                for v in vulnerabilities
-            ],
+            "vulnerabilities": list(map(to_report_dict, vulnerabilities)),
             "correlated_findings": correlated_findings,
             "risk_score": risk_score,
         }
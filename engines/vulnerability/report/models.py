@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Any
 
 from engines.vulnerability.risk.models import RiskScore
+from engines.report.serialize import to_report_dict
 
 
 @dataclass
@@ -22,10 +23,7 @@ class UnifiedSecurityReport:
             "metadata": self.metadata,
             "ara": self.ara,
             "vulnerabilities": self.vulnerabilities,
-            "correlated_findings": [
-                f.as_dict() if hasattr(f, "as_dict") else f
-                for f in self.correlated_findings
-            ],
+            "correlated_findings": list(map(to_report_dict, self.correlated_findings)),
             "risk_score": self.risk_score.as_dict(),
             "summary": self.summary,
             "correlation": self.correlation,
@@ -31,6 +31,7 @@ class RiskScoringEngine:
         """
 
         total_risk = 0.0
+        mitigated = 0
         explanation = []
 
         if not correlated_findings:
@@ -51,6 +52,9 @@ class RiskScoringEngine:
             risk = base * multiplier * confidence
             total_risk += risk
 
+            if mitigation == "MITIGATED":
+                mitigated += 1
+
             explanation.append(
                 f"{f.owasp_id} {f.title}: {sev} "
                 f"({mitigation}, confidence={confidence:.2f})"
@@ -61,7 +65,9 @@ class RiskScoringEngine:
         return RiskScore(
             numeric=normalized,
             level=self._level(normalized),
-            explanation=self._summarize(normalized, correlated_findings, explanation),
+            explanation=self._summarize(
+                normalized, mitigated, len(correlated_findings), explanation
+            ),
         )
 
     # --------------------------------------------------
@@ -75,7 +81,9 @@ class RiskScoringEngine:
             return "HIGH"
         return "CRITICAL"
 
-    def _summarize(self, score: int, findings: List, raw: List[str]) -> List[str]:
+    def _summarize(
+        self, score: int, mitigated: int, total: int, raw: List[str]
+    ) -> List[str]:
         summary = []
 
         if score <= 20:
@@ -87,8 +95,8 @@ class RiskScoringEngine:
         else:
             summary.append("Application is CRITICALLY vulnerable")
 
-        mitigated = sum(1 for f in findings if f.mitigation_status == "MITIGATED")
-        summary.append(f"{mitigated}/{len(findings)} findings mitigated by protections")
+        # mitigated is counted during the scoring pass in calculate()
+        summary.append(f"{mitigated}/{total} findings mitigated by protections")
 
         # Add top 3 technical reasons
         summary.extend(raw[:3])
@@ -55,20 +55,18 @@ class RiskScoringEngine:
         # Determine risk level
         risk_level = self._level(total_score)
 
-        # Prepend summary explanations
-        explanations.insert(
-            0,
-            f"{mitigated_count}/{len(correlated_findings)} findings mitigated"
-        )
-        explanations.insert(
-            0,
-            f"Overall application risk is {risk_level}"
-        )
+        # Summary explanations first, then per-finding lines
+        # (built once instead of shifting the list with insert(0))
+        summary = [
+            f"Overall application risk is {risk_level}",
+            f"{mitigated_count}/{len(correlated_findings)} findings mitigated",
+        ]
+        summary.extend(explanations)
 
         return {
             "numeric": total_score,
             "level": risk_level,
-            "explanation": explanations,
+            "explanation": summary,
         }
 
     def _level(self, score: int) -> str:
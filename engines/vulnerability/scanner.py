@@ -2,6 +2,7 @@
 
 from typing import List
 from .models import VulnerabilitySignal
+from .smali_reader import shared_scan
 
 from .signals.smali import SmaliSignalScanner
 from .signals.manifest import ManifestVulnerabilityScanner
@@ -33,10 +34,14 @@ class VulnerabilityScanner:
     def scan(self, workspace: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
-        for scanner in self.scanners:
-            try:
-                signals.extend(scanner.scan(workspace))
-            except Exception as e:
-                print(f"[!] {scanner.__class__.__name__} failed: {e}")
+        # scanners share one walk of the smali tree, one read of each
+        # file and one manifest parse through smali_reader, for this
+        # scan only
+        with shared_scan():
+            for scanner in self.scanners:
+                try:
+                    signals.extend(scanner.scan(workspace))
+                except Exception as e:
+                    print(f"[!] {scanner.__class__.__name__} failed: {e}")
 
         return signals
@@ -1,5 +1,29 @@
-from .smali import SmaliSignalScanner
-from .manifest import ManifestVulnerabilityScanner
-from .java import JavaVulnerabilityScanner
-from .native import NativeVulnerabilityScanner
-from .resources import ResourceVulnerabilityScanner
+# Scanners are resolved on first access: importing one submodule
+# (e.g. signals.smali) no longer loads every sibling scanner with it
+_SCANNERS = {
+    "SmaliSignalScanner": ".smali",
+    "ManifestVulnerabilityScanner": ".manifest",
+    "JavaVulnerabilityScanner": ".java",
+    "NativeVulnerabilityScanner": ".native",
+    "ResourceVulnerabilityScanner": ".resources",
+}
+
+__all__ = list(_SCANNERS)
+
+
+def __getattr__(name):
+    module = _SCANNERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+
+    # cached as a module global: later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    # set union: names already resolved into globals() are listed once
+    return sorted(set(globals()).union(__all__))
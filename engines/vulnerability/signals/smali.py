@@ -1,5 +1,6 @@
 # engines/vulnerability/signals/smali.py
 import os
+import re
 from typing import List
 
 from engines.vulnerability.models import VulnerabilitySignal
@@ -58,28 +59,58 @@ class SmaliSignalScanner(BaseVulnerabilityScanner):
         },
     ]
 
+    # keywords lowered once per pattern: lines are matched lowered, so a
+    # mixed-case entry such as "loadDataWithBaseURL" must be too
+    _PATTERN_KEYWORDS = tuple(
+        tuple(k.lower() for k in pattern["keywords"])
+        for pattern in SIGNAL_PATTERNS
+    )
+
+    # one compiled alternation per pattern: a candidate line is tested
+    # by a single C-level search instead of a generator over keywords
+    _PATTERN_RES = tuple(
+        re.compile("|".join(re.escape(k) for k in keywords))
+        for keywords in _PATTERN_KEYWORDS
+    )
+
+    # every keyword of every pattern, matched against the lowered file text
+    _ANY_KEYWORD_RE = re.compile(
+        "|".join(
+            re.escape(k)
+            for keywords in _PATTERN_KEYWORDS
+            for k in keywords
+        )
+    )
+
     def scan(self, root_path: str) -> List[VulnerabilitySignal]:
         signals: List[VulnerabilitySignal] = []
 
+        # os.walk roots always extend root_path, so the relative path is a
+        # plain slice (relpath would abspath/normpath, i.e. getcwd, per file)
+        prefix_len = len(root_path)
+
         for root, _, files in os.walk(root_path):
             for file in files:
                 if not file.endswith(".smali"):
                     continue
 
                 full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, root_path)
+                rel_path = full_path[prefix_len:].lstrip(os.sep)
 
                 try:
                     with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = f.readlines()
+                        text = f.read()
                 except Exception:
                     continue
 
-                for idx, line in enumerate(lines):
+                for idx, line in self._candidate_lines(text):
                     l = line.lower().strip()
+                    code = line.strip()
 
-                    for pattern in self.SIGNAL_PATTERNS:
-                        if any(k in l for k in pattern["keywords"]):
+                    for pattern, pattern_re in zip(
+                        self.SIGNAL_PATTERNS, self._PATTERN_RES
+                    ):
+                        if pattern_re.search(l):
                             signals.append(
                                 VulnerabilitySignal(
                                     owasp_id=pattern["owasp_id"],
@@ -88,10 +119,59 @@ class SmaliSignalScanner(BaseVulnerabilityScanner):
                                     source="smali",
                                     file=rel_path,
                                     line=idx + 1,
-                                    code=line.strip(),
-                                    evidence=[line.strip()],
+                                    code=code,
+                                    evidence=[code],
                                     confidence=pattern["confidence"],
                                 )
                             )
 
         return signals
+
+    def _candidate_lines(self, text: str):
+        """
+        Yield (index, line) only for lines holding at least one keyword,
+        located with a single regex pass over the whole file.
+        """
+        lowered = text.lower()
+
+        search = self._ANY_KEYWORD_RE.search
+        m = search(lowered)
+        if m is None:
+            return
+
+        if len(lowered) != len(text):
+            # a character grew when lowered: offsets no longer line up
+            # with the original text, so fall back to splitting it
+            yield from self._candidate_lines_split(text, lowered)
+            return
+
+        # every hit yields its own line straight from the match offset;
+        # the search resumes at the end of that line, so the file is
+        # never split and each line is reported once
+        line_no = 0
+        last_pos = 0
+        while m is not None:
+            start = lowered.rfind("\n", 0, m.start()) + 1
+            end = lowered.find("\n", m.end())
+            if end == -1:
+                end = len(lowered)
+
+            line_no += lowered.count("\n", last_pos, start)
+            last_pos = start
+
+            yield line_no, text[start:end]
+            m = search(lowered, end)
+
+    def _candidate_lines_split(self, text: str, lowered: str):
+        hits = []
+        line_no = 0
+        last_pos = 0
+        for m in self._ANY_KEYWORD_RE.finditer(lowered):
+            line_no += lowered.count("\n", last_pos, m.start())
+            last_pos = m.start()
+            if not hits or hits[-1] != line_no:
+                hits.append(line_no)
+
+        lines = text.split("\n")
+        for idx in hits:
+            yield idx, lines[idx]
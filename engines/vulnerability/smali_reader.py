@@ -0,0 +1,109 @@
+# engines/vulnerability/smali_reader.py
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+# (path, mtime_ns, size) -> lines and root -> .smali paths, only while a
+# shared_scan() block is open; outside one every call goes to disk and
+# nothing is retained
+_lines_cache: Optional[Dict[Tuple[str, int, int], Tuple[str, ...]]] = None
+_files_cache: Optional[Dict[str, Tuple[str, ...]]] = None
+# name -> dict, for other readers (e.g. the manifest parser) to share
+# results under the same scan scope
+_named_caches: Optional[Dict[str, dict]] = None
+
+
+@contextmanager
+def shared_scan() -> Iterator[None]:
+    """
+    Share file reads and directory listings between the scanners of
+    one scan run. The caches are dropped when the block exits; nested
+    blocks reuse the outermost one.
+    """
+    global _lines_cache, _files_cache, _named_caches
+    if _lines_cache is not None:
+        yield
+        return
+
+    _lines_cache, _files_cache, _named_caches = {}, {}, {}
+    try:
+        yield
+    finally:
+        _lines_cache = _files_cache = _named_caches = None
+
+
+def scan_cache(name: str) -> Optional[dict]:
+    """
+    The dict `name` of the open shared_scan(), created on first use;
+    None outside a scan, so callers fall back to uncached work.
+    """
+    caches = _named_caches
+    if caches is None:
+        return None
+    return caches.setdefault(name, {})
+
+
+def read_smali_lines(path: str) -> Tuple[str, ...]:
+    """
+    Lines of a smali file. Inside shared_scan() each file is read once
+    and shared; the key includes mtime/size, so an edited file is read
+    again. Errors propagate like open(); failed reads are never cached.
+    """
+    cache = _lines_cache
+    if cache is None:
+        return _read_lines(path)
+
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    lines = cache.get(key)
+    if lines is None:
+        lines = cache[key] = _read_lines(path)
+    return lines
+
+
+def _read_lines(path: str) -> Tuple[str, ...]:
+    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+        return tuple(fh.readlines())
+
+
+def list_smali_files(root: str) -> Tuple[str, ...]:
+    """
+    Every .smali path under `root`, in os.walk order.
+    Inside shared_scan() the tree is walked once and shared between
+    scanners; otherwise it is walked on every call.
+    """
+    cache = _files_cache
+    if cache is None:
+        return tuple(_iter_smali_files(root))
+
+    files = cache.get(root)
+    if files is None:
+        files = cache[root] = tuple(_iter_smali_files(root))
+    return files
+
+
+def _iter_smali_files(root: str) -> Iterator[str]:
+    # os.scandir directly: DirEntry carries the file type, so no
+    # per-directory name lists or extra stat() calls are needed
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            # like os.walk(followlinks=False): symlinked dirs are not entered
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".smali"):
+            yield entry.path
+
+    for path in subdirs:
+        yield from _iter_smali_files(path)
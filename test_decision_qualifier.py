@@ -0,0 +1,58 @@
+# test_decision_qualifier.py
+
+from core.decision.decision_qualifier import DecisionQualifierV1
+from core.decision.models import DecisionPoint
+
+
+def _throw(snippet):
+    return DecisionPoint(
+        language="smali",
+        class_name="com/app/net/PinningTrustManager",
+        method_name="checkServerTrusted",
+        decision_type="throw_exception",
+        reason="throw",
+        instruction_index=3,
+        instruction_snippet=snippet,
+    )
+
+
+def test_extracts_exception_type():
+    d = _throw([
+        "    new-instance v1, Ljava/lang/StringBuilder;\n",
+        "    new-instance v0, Ljava/security/cert/CertificateException;\n",
+        "    throw v0\n",
+    ])
+    q = DecisionQualifierV1()
+
+    assert q._extract_exception_type(d) == "Ljava/security/cert/CertificateException;"
+    assert q.is_security_relevant(d)
+
+
+def test_extracts_assertion_error():
+    d = _throw([
+        "    new-instance v0, Ljava/lang/AssertionError;\n",
+        "    invoke-direct {v0}, Ljava/lang/AssertionError;-><init>()V\n",
+        "    throw v0\n",
+    ])
+    q = DecisionQualifierV1()
+
+    assert q._extract_exception_type(d) == "Ljava/lang/AssertionError;"
+    assert q.is_security_relevant(d)
+
+
+def test_unlisted_exception_is_not_relevant():
+    d = _throw([
+        "    new-instance v0, Ljava/lang/IllegalStateException;\n",
+        "    throw v0\n",
+    ])
+    q = DecisionQualifierV1()
+
+    assert q._extract_exception_type(d) == "Ljava/lang/IllegalStateException;"
+    assert not q.is_security_relevant(d)
+
+
+if __name__ == "__main__":
+    test_extracts_exception_type()
+    test_extracts_assertion_error()
+    test_unlisted_exception_is_not_relevant()
+    print("decision qualifier: ok")
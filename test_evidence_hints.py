@@ -0,0 +1,37 @@
+# test_evidence_hints.py
+
+from engines.protection.pipeline import ProtectionPipeline
+
+
+def test_each_hint_keyword_sets_its_flag():
+    flags = ProtectionPipeline()._evidence_hint_flags
+
+    for hint in ProtectionPipeline.ANTI_INSTR_EVIDENCE_HINTS:
+        assert flags(f"invoke-static {{}}, {hint}") == (True, False), hint
+
+    for hint in ProtectionPipeline.EMULATOR_EVIDENCE_HINTS:
+        assert flags(f"const-string v0, \"{hint}\"") == (False, True), hint
+
+
+def test_hint_flags_match_substring_checks():
+    pipeline = ProtectionPipeline()
+    blobs = [
+        "",
+        "return-void",
+        "timingoldfish",
+        "const-string v0, \"frida\" const-string v1, \"qemu\"",
+        "['if-eqz v0, :cond_0', 'invoke-virtual {v0}, debugger']",
+    ]
+
+    for blob in blobs:
+        expected = (
+            any(h in blob for h in pipeline.ANTI_INSTR_EVIDENCE_HINTS),
+            any(h in blob for h in pipeline.EMULATOR_EVIDENCE_HINTS),
+        )
+        assert pipeline._evidence_hint_flags(blob) == expected, blob
+
+
+if __name__ == "__main__":
+    test_each_hint_keyword_sets_its_flag()
+    test_hint_flags_match_substring_checks()
+    print("evidence hints: ok")
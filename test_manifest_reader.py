@@ -0,0 +1,75 @@
+# test_manifest_reader.py
+
+from engines.vulnerability import smali_reader
+from engines.vulnerability.manifest.reader import parse_manifest
+from engines.vulnerability.manifest.exported_scanner import ExportedComponentScanner
+from engines.vulnerability.smali_reader import shared_scan
+
+MANIFEST = (
+    '<manifest xmlns:android="http://schemas.android.com/apk/res/android" '
+    'package="com.app">\n'
+    "  <application>\n"
+    "{components}"
+    "  </application>\n"
+    "</manifest>\n"
+)
+
+EXPORTED_ACTIVITY = (
+    '    <activity android:name=".{name}" android:exported="true"/>\n'
+)
+
+
+def _write_manifest(tmp_path, *names):
+    path = tmp_path / "AndroidManifest.xml"
+    components = "".join(EXPORTED_ACTIVITY.format(name=n) for n in names)
+    path.write_text(MANIFEST.format(components=components), encoding="utf-8")
+    return str(path)
+
+
+def test_parse_outside_shared_scan_is_not_cached(tmp_path):
+    path = _write_manifest(tmp_path, "Main")
+
+    assert parse_manifest(path) is not parse_manifest(path)
+    assert smali_reader.scan_cache("manifest") is None
+
+
+def test_shared_scan_parses_once_and_drops_the_tree(tmp_path):
+    path = _write_manifest(tmp_path, "Main")
+
+    with shared_scan():
+        first = parse_manifest(path)
+        assert parse_manifest(path) is first
+
+        _write_manifest(tmp_path, "Main", "Other")
+        assert len(parse_manifest(path).find("application")) == 2
+
+    assert smali_reader.scan_cache("manifest") is None
+    assert parse_manifest(path) is not first
+
+
+def test_scanner_sees_edited_manifest_across_scans(tmp_path):
+    scanner = ExportedComponentScanner()
+    path = _write_manifest(tmp_path, "Main")
+
+    with shared_scan():
+        first = scanner.scan(path)
+
+    _write_manifest(tmp_path, "Main", "Other")
+    with shared_scan():
+        second = scanner.scan(path)
+
+    assert len(second) == len(first) + 1
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    for test in (
+        test_parse_outside_shared_scan_is_not_cached,
+        test_shared_scan_parses_once_and_drops_the_tree,
+        test_scanner_sees_edited_manifest_across_scans,
+    ):
+        with tempfile.TemporaryDirectory() as d:
+            test(pathlib.Path(d))
+    print("manifest reader: ok")
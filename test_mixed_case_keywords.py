@@ -0,0 +1,47 @@
+# test_mixed_case_keywords.py
+
+from core.strategy.alvd_posture import ALVDPostureAnalyzer
+from core.strategy.alvd_signal import ALVDSignalScanner
+from engines.vulnerability.signals.smali import SmaliSignalScanner
+
+
+def test_smali_scanner_matches_load_data_with_base_url(tmp_path):
+    (tmp_path / "Web.smali").write_text(
+        "invoke-virtual {v0, v1}, Landroid/webkit/WebView;"
+        "->loadDataWithBaseURL(Ljava/lang/String;)V\n",
+        encoding="utf-8",
+    )
+
+    signals = SmaliSignalScanner().scan(str(tmp_path))
+
+    assert [(s.owasp_id, s.subtype, s.line) for s in signals] == [
+        ("M5", "webview_insecure_load", 1),
+    ]
+
+
+def test_alvd_scanner_counts_user_id(tmp_path):
+    (tmp_path / "Clone.smali").write_text(
+        "iget v0, p0, Landroid/os/UserHandle;->userId:I\n"
+        "nop\n",
+        encoding="utf-8",
+    )
+
+    signals = ALVDSignalScanner().scan(str(tmp_path))
+    posture = ALVDPostureAnalyzer().analyze(signals)
+
+    assert signals == {"abnormal_uid": 1}
+    assert posture["signal_score"] == ALVDPostureAnalyzer.SIGNAL_WEIGHTS["abnormal_uid"]
+    assert posture["present"] is True
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    for test in (
+        test_smali_scanner_matches_load_data_with_base_url,
+        test_alvd_scanner_counts_user_id,
+    ):
+        with tempfile.TemporaryDirectory() as d:
+            test(pathlib.Path(d))
+    print("mixed-case keywords: ok")
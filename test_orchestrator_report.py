@@ -0,0 +1,81 @@
+# test_orchestrator_report.py
+
+from engines.vulnerability.correlation.engine import CorrelationEngine
+from engines.vulnerability.engine import VulnerabilityEngine
+from engines.vulnerability.findings import VulnerabilityFinding
+from engines.vulnerability.orchestrator import M_ILEAOrchestrator
+
+
+class FixedVulnerabilityEngine(VulnerabilityEngine):
+    """Stage 1 returning a fixed finding list (the real scan is a stub)."""
+
+    def __init__(self, findings):
+        super().__init__()
+        self.findings = findings
+
+    def scan(self, workspace_path):
+        return list(self.findings)
+
+
+def _finding(owasp_id, subtype, severity):
+    return VulnerabilityFinding(
+        owasp_id=owasp_id,
+        title=f"{owasp_id} finding",
+        category="TEST",
+        subtype=subtype,
+        severity=severity,
+        confidence=0.8,
+        description=subtype,
+        recommendation="fix it",
+        remediation="fix it",
+    )
+
+
+def test_report_vulnerabilities_match_scanned_findings(tmp_path):
+    (tmp_path / "smali").mkdir()
+    vulnerabilities = [
+        _finding("M5", "cleartext_http", "HIGH"),
+        _finding("M8", "code_tampering", "MEDIUM"),
+        _finding("M5", "weak_tls", "LOW"),
+        _finding("M1", "hardcoded_key", "CRITICAL"),
+    ]
+
+    orchestrator = M_ILEAOrchestrator()
+    orchestrator.vuln_engine = FixedVulnerabilityEngine(vulnerabilities)
+    report = orchestrator._build_report(str(tmp_path), None)
+
+    assert report["vulnerabilities"] == [v.as_dict() for v in vulnerabilities]
+
+
+class DroppingCorrelationEngine(CorrelationEngine):
+    def correlate(self, vulnerabilities, protection_profile):
+        return super().correlate(vulnerabilities, protection_profile)[1:]
+
+
+def test_report_refuses_misaligned_correlation(tmp_path):
+    (tmp_path / "smali").mkdir()
+
+    orchestrator = M_ILEAOrchestrator()
+    orchestrator.vuln_engine = FixedVulnerabilityEngine([
+        _finding("M5", "cleartext_http", "HIGH"),
+        _finding("M8", "code_tampering", "MEDIUM"),
+    ])
+    orchestrator.correlation_engine = DroppingCorrelationEngine()
+
+    try:
+        orchestrator._build_report(str(tmp_path), None)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("misaligned correlation was not rejected")
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as d:
+        test_report_vulnerabilities_match_scanned_findings(pathlib.Path(d))
+    with tempfile.TemporaryDirectory() as d:
+        test_report_refuses_misaligned_correlation(pathlib.Path(d))
+    print("orchestrator report: ok")
@@ -0,0 +1,126 @@
+# test_parallel_parity.py
+#
+# The opt-in process pools (max_workers > 1) must give exactly the
+# results of the sequential runs.
+
+from core.localization.pipeline_decision import DecisionLocalizationPipeline
+from engines.protection.pipeline import ProtectionPipeline
+from engines.protection.strategy_pipeline import StrategyPipeline
+
+SMALI_FILES = {
+    "com/app/net/Pinning.smali": (
+        ".class public Lcom/app/net/Pinning;\n"
+        ".method public checkServerTrusted()V\n"
+        "    if-eqz v0, :ok\n"
+        "    new-instance v0, Ljava/security/cert/CertificateException;\n"
+        "    throw v0\n"
+        "    :ok\n"
+        "    return-void\n"
+        ".end method\n"
+    ),
+    "com/app/sec/RootCheck.smali": (
+        ".class public Lcom/app/sec/RootCheck;\n"
+        ".method public isRooted()Z\n"
+        "    const-string v0, \"/system/xbin/su\"\n"
+        "    const-string v1, \"com.topjohnwu.magisk\"\n"
+        "    if-nez v0, :root\n"
+        "    invoke-static {v0}, Ljava/lang/System;->exit(I)V\n"
+        "    :root\n"
+        "    return-void\n"
+        ".end method\n"
+    ),
+    "com/app/sec/EnvCheck.smali": (
+        ".class public Lcom/app/sec/EnvCheck;\n"
+        ".method public check()V\n"
+        "    const-string v0, \"goldfish\"\n"
+        "    const-string v1, \"/proc/self/status\"\n"
+        "    const-string v2, \"TracerPid\"\n"
+        "    const-string v3, \"frida\"\n"
+        "    const-string v4, \"/data/data/com.vmos\"\n"
+        "    if-eqz v0, :done\n"
+        "    new-instance v0, Ljava/lang/SecurityException;\n"
+        "    throw v0\n"
+        "    :done\n"
+        "    return-void\n"
+        ".end method\n"
+    ),
+}
+
+
+def _write_workspace(tmp_path, copies=4):
+    root = tmp_path / "smali"
+    for i in range(copies):
+        for rel, text in SMALI_FILES.items():
+            path = root / f"p{i}" / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+    return str(root)
+
+
+def _decision_key(d):
+    return (
+        d.class_name,
+        d.method_name,
+        d.decision_type,
+        d.reason,
+        d.instruction_index,
+        list(d.instruction_snippet),
+        list(d._smali_lines),
+    )
+
+
+def test_decision_pipeline_pool_matches_sequential(tmp_path):
+    root = _write_workspace(tmp_path)
+
+    sequential = DecisionLocalizationPipeline().collect_raw_decisions(root)
+    pooled = DecisionLocalizationPipeline(max_workers=2).collect_raw_decisions(root)
+
+    assert sequential
+    assert list(map(_decision_key, pooled)) == list(map(_decision_key, sequential))
+
+
+def _run_key(result):
+    return {
+        **{k: v for k, v in result.items() if k != "profile"},
+        "profile": result["profile"].as_dict(),
+    }
+
+
+def test_protection_pipeline_pool_matches_sequential(tmp_path):
+    root = _write_workspace(tmp_path)
+
+    sequential = ProtectionPipeline().run(root)
+    pooled = ProtectionPipeline(max_workers=4).run(root)
+
+    assert sequential["alvd_signals"] and sequential["emulator_signals"]
+    assert _run_key(pooled) == _run_key(sequential)
+
+
+def test_strategy_pipeline_pool_matches_sequential(tmp_path):
+    root = _write_workspace(tmp_path)
+    decisions = DecisionLocalizationPipeline()
+    evidences = decisions.extract_evidence(
+        decisions.run_on_smali_dir(root)
+    )
+
+    pooled_pipeline = StrategyPipeline(max_workers=2)
+    pooled_pipeline.PARALLEL_MIN_EVIDENCES = 1
+
+    sequential = StrategyPipeline().infer_from_evidence(evidences)
+    pooled = pooled_pipeline.infer_from_evidence(evidences)
+
+    assert len(evidences) > 2 and sequential
+    assert pooled == sequential
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as d:
+        test_decision_pipeline_pool_matches_sequential(pathlib.Path(d))
+    with tempfile.TemporaryDirectory() as d:
+        test_protection_pipeline_pool_matches_sequential(pathlib.Path(d))
+    with tempfile.TemporaryDirectory() as d:
+        test_strategy_pipeline_pool_matches_sequential(pathlib.Path(d))
+    print("parallel parity: ok")
@@ -0,0 +1,32 @@
+# test_report_serialize.py
+
+from engines.report.builder import UnifiedReportBuilder
+from engines.report.serialize import to_report_dict
+from engines.vulnerability.correlation.models import CorrelatedFinding
+from engines.vulnerability.report.builder import (
+    UnifiedReportBuilder as VulnerabilityReportBuilder,
+)
+
+
+def test_to_report_dict():
+    shared = {"owasp_id": "M5"}
+    finding = CorrelatedFinding("M5", "t", "HIGH", "LOW", "MITIGATED")
+
+    assert to_report_dict(shared) is shared
+    assert to_report_dict(finding) == finding.as_dict()
+    assert to_report_dict(None) is None
+
+
+def test_builders_share_conversion():
+    finding = CorrelatedFinding("M5", "t", "HIGH", "LOW", "MITIGATED")
+    kwargs = dict(metadata={}, ara={}, correlated_findings=[], risk_score={})
+
+    for builder in (UnifiedReportBuilder(), VulnerabilityReportBuilder()):
+        report = builder.build(vulnerabilities=[finding, {"a": 1}], **kwargs)
+        assert report["vulnerabilities"] == [finding.as_dict(), {"a": 1}]
+
+
+if __name__ == "__main__":
+    test_to_report_dict()
+    test_builders_share_conversion()
+    print("report serialize: ok")
@@ -0,0 +1,32 @@
+# test_signals_package.py
+
+import engines.vulnerability.signals as signals
+
+
+def test_star_import_exports_every_scanner():
+    namespace = {}
+    exec("from engines.vulnerability.signals import *", namespace)
+
+    for name in signals._SCANNERS:
+        assert isinstance(namespace[name], type), name
+
+
+def test_dir_lists_scanners():
+    listed = dir(signals)
+
+    for name in signals._SCANNERS:
+        assert name in listed, name
+
+
+def test_resolved_scanner_is_cached_in_module():
+    scanner = signals.SmaliSignalScanner
+
+    assert vars(signals)["SmaliSignalScanner"] is scanner
+    assert signals.SmaliSignalScanner is scanner
+
+
+if __name__ == "__main__":
+    test_star_import_exports_every_scanner()
+    test_dir_lists_scanners()
+    test_resolved_scanner_is_cached_in_module()
+    print("signals package: ok")
@@ -0,0 +1,87 @@
+# test_smali_reader.py
+
+from engines.vulnerability import smali_reader
+from engines.vulnerability.crypto.weak_crypto_scanner import WeakCryptographyScanner
+from engines.vulnerability.smali_reader import (
+    list_smali_files,
+    read_smali_lines,
+    shared_scan,
+)
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_read_outside_shared_scan_is_not_cached(tmp_path):
+    path = _write(tmp_path / "A.smali", "const-string v0, \"a\"\n")
+    assert read_smali_lines(path) == ('const-string v0, "a"\n',)
+
+    _write(tmp_path / "A.smali", "nop\n")
+    assert read_smali_lines(path) == ("nop\n",)
+    assert smali_reader._lines_cache is None
+
+
+def test_shared_scan_reuses_reads_and_rereads_edited_files(tmp_path):
+    path = _write(tmp_path / "A.smali", "nop\n")
+
+    with shared_scan():
+        first = read_smali_lines(path)
+        assert read_smali_lines(path) is first
+
+        _write(tmp_path / "A.smali", "return-void\nnop\n")
+        assert read_smali_lines(path) == ("return-void\n", "nop\n")
+
+    assert smali_reader._lines_cache is None
+
+
+def test_standalone_scanner_sees_edited_file(tmp_path):
+    _write(tmp_path / "A.smali", "nop\n")
+    scanner = WeakCryptographyScanner()
+    assert scanner.scan(str(tmp_path)) == []
+
+    _write(tmp_path / "A.smali", "invoke-static {v0}, Lx;->md5()V\n")
+    subtypes = [s.subtype for s in scanner.scan(str(tmp_path))]
+    assert subtypes == ["weak_hash_md5"]
+
+
+def test_standalone_scanner_sees_added_and_removed_files(tmp_path):
+    md5_line = "invoke-static {v0}, Lx;->md5()V\n"
+    _write(tmp_path / "A.smali", md5_line)
+    scanner = WeakCryptographyScanner()
+    assert [s.file for s in scanner.scan(str(tmp_path))] == ["A.smali"]
+
+    (tmp_path / "pkg").mkdir()
+    _write(tmp_path / "pkg" / "B.smali", md5_line)
+    (tmp_path / "A.smali").unlink()
+    assert [s.file for s in scanner.scan(str(tmp_path))] == ["pkg/B.smali"]
+
+
+def test_shared_scan_lists_tree_once(tmp_path):
+    _write(tmp_path / "A.smali", "nop\n")
+    root = str(tmp_path)
+
+    with shared_scan():
+        first = list_smali_files(root)
+        _write(tmp_path / "B.smali", "nop\n")
+        assert list_smali_files(root) is first
+
+    assert len(list_smali_files(root)) == 2
+    assert smali_reader._files_cache is None
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    for test in (
+        test_read_outside_shared_scan_is_not_cached,
+        test_shared_scan_reuses_reads_and_rereads_edited_files,
+        test_standalone_scanner_sees_edited_file,
+        test_standalone_scanner_sees_added_and_removed_files,
+        test_shared_scan_lists_tree_once,
+    ):
+        with tempfile.TemporaryDirectory() as d:
+            test(pathlib.Path(d))
+    print("smali_reader: ok")
@@ -0,0 +1,30 @@
+# test_smali_stream.py
+
+import re
+
+from core.strategy.smali_stream import iter_keyword_lines
+
+
+def test_iter_keyword_lines_across_block_boundaries(tmp_path):
+    path = tmp_path / "A.smali"
+    path.write_text(
+        "nop\n" * 50
+        + "const-string v0, \"ro.kernel.QEMU\"\n"
+        + "nop\n" * 50
+        + "const-string v1, \"Goldfish\"",
+        encoding="utf-8",
+    )
+    search = re.compile("qemu|goldfish").search
+
+    expected = ['const-string v0, "ro.kernel.qemu"', 'const-string v1, "goldfish"']
+    for block_hint in (1, 16, 1 << 16):
+        assert list(iter_keyword_lines(str(path), search, block_hint)) == expected
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as d:
+        test_iter_keyword_lines_across_block_boundaries(pathlib.Path(d))
+    print("smali_stream: ok")